@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import random
+import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.engine import maps as map_loader
 from app.engine.state import (
     AchievementState,
+    BoardState,
     COST,
     DEV_TYPES,
     GameState,
@@ -138,16 +140,27 @@ def build_game(
     return g
 
 
+def _incident_edges(g: GameState, vid: int) -> List[Tuple[int, int]]:
+    # the UI's own Game has no BoardState index, so scan its edge set there
+    board = getattr(g, "board", None)
+    if isinstance(board, BoardState):
+        return board.vertex_edges(vid)
+    return [e for e in g.edges if vid in e]
+
+
 def can_place_settlement(g: GameState, pid: int, vid: int, require_road: bool) -> bool:
-    if vid in g.occupied_v:
+    occupied_v = g.occupied_v
+    if vid in occupied_v:
         return False
-    for nb in edge_neighbors_of_vertex(g.edges, vid):
-        if nb in g.occupied_v:
+    incident = _incident_edges(g, vid)
+    for a, b in incident:
+        if (b if a == vid else a) in occupied_v:
             return False
     if not require_road:
         return True
-    for e in g.edges:
-        if vid in e and g.occupied_e.get(e) == pid:
+    occupied_e = g.occupied_e
+    for e in incident:
+        if occupied_e.get(e) == pid:
             return True
     return False
 
@@ -281,15 +294,20 @@ def pay_to_bank(g: GameState, pid: int, cost: Dict[str, int]) -> None:
 
 def distribute_for_roll(g: GameState, roll: int) -> None:
     robbers = set(getattr(g, "robbers", []) or [g.robber_tile])
+    # tile attributes are read once per tile, not once per (settlement, hex) pair
+    producing: Dict[int, str] = {}
+    for ti, t in enumerate(g.tiles):
+        if t.number != roll or ti in robbers:
+            continue
+        res = TERRAIN_TO_RES.get(t.terrain)
+        if res:
+            producing[ti] = res
+    if not producing:
+        return
     for vid, (pid, level) in g.occupied_v.items():
         for ti in g.vertex_adj_hexes.get(vid, []):
-            t = g.tiles[ti]
-            if t.number != roll:
-                continue
-            if ti in robbers:
-                continue
-            res = TERRAIN_TO_RES.get(t.terrain)
-            if not res:
+            res = producing.get(ti)
+            if res is None:
                 continue
             amount = 2 if level == 2 else 1
             give = min(amount, g.bank.get(res, 0))
@@ -408,7 +426,8 @@ def _normalize_port_kind(kind: Optional[str]) -> Optional[str]:
         return None
     s = str(kind).strip().lower()
     if s in RESOURCES:
-        return s
+        # strip()/lower() build fresh strings; hand back the shared key object
+        return sys.intern(s)
     if s in ("3:1", "3", "generic", "any", "all", "none", "?"):
         return "3:1"
     if "3:1" in s or "3/1" in s or "3 to 1" in s or "3to1" in s:
@@ -440,6 +459,15 @@ def _iter_ports(ports):
         yield a, b, kind
 
 
+def port_vertices(g: GameState) -> Dict[int, str]:
+    # vertex -> kind of the first port touching it, in g.ports order
+    out: Dict[int, str] = {}
+    for a, b, kind in _iter_ports(g.ports):
+        out.setdefault(a, kind)
+        out.setdefault(b, kind)
+    return out
+
+
 def player_ports(g: GameState, pid: int) -> set:
     owned = {vid for vid, (owner, _lvl) in g.occupied_v.items() if owner == pid}
     ports = set()
@@ -606,6 +634,7 @@ def play_dev(g: GameState, pid: int, card_type: str, **kwargs) -> Dict:
 
 
 def _hand_size(g: GameState, pid: int) -> int:
+    # the UI's own Player objects come through here too, so no PlayerState.hand_size
     return sum(int(v) for v in g.players[pid].res.values())
 
 
@@ -639,14 +668,22 @@ def _apply_discard(g: GameState, pid: int, discard: Dict[str, int]) -> None:
         g.bank[r] += q
 
 
+def _tile_vertex_ids(g: GameState, tile: int) -> List[int]:
+    # the UI hands in its own Game without a BoardState; scan vertex_adj_hexes there
+    board = getattr(g, "board", None)
+    if isinstance(board, BoardState):
+        return board.tile_vertices(tile)
+    return [vid for vid, tis in g.vertex_adj_hexes.items() if tile in tis]
+
+
 def _victims_for_tile(g: GameState, tile: int, thief_pid: int) -> List[int]:
     victims = set()
-    for vid, (owner, _level) in g.occupied_v.items():
-        if owner == thief_pid:
+    for vid in _tile_vertex_ids(g, tile):
+        occ = g.occupied_v.get(vid)
+        if occ is None or occ[0] == thief_pid:
             continue
-        if tile in g.vertex_adj_hexes.get(vid, []):
-            if _hand_size(g, owner) > 0:
-                victims.add(owner)
+        if _hand_size(g, occ[0]) > 0:
+            victims.add(occ[0])
     return sorted(victims)
 
 
@@ -665,12 +702,12 @@ def _collect_gold_yields(g: GameState, roll: int) -> Dict[int, int]:
     if not getattr(g.rules_config, "enable_gold", False):
         return {}
     gold: Dict[int, int] = {}
+    gold_tiles = {ti for ti, t in enumerate(g.tiles) if t.number == roll and t.terrain == "gold"}
+    if not gold_tiles:
+        return gold
     for vid, (pid, level) in g.occupied_v.items():
         for ti in g.vertex_adj_hexes.get(vid, []):
-            t = g.tiles[ti]
-            if t.number != roll:
-                continue
-            if t.terrain != "gold":
+            if ti not in gold_tiles:
                 continue
             amount = 2 if level == 2 else 1
             gold[pid] = int(gold.get(pid, 0)) + int(amount)
@@ -757,6 +794,38 @@ def apply_cmd(g: GameState, pid: int, cmd: Dict) -> Tuple[GameState, List[Dict]]
             g.players[pid].res[r] += qty
         return g, events
 
+    if ctype == "grant_resources_bulk":
+        # validated as a whole first, so a short bank leaves every hand untouched
+        bulk_grants: List[Tuple[int, str, int]] = []
+        bulk_need: Dict[str, int] = {}
+        grants = cmd.get("grants", [])
+        if not isinstance(grants, list):
+            raise RuleError("invalid", "grants must be a list")
+        for grant in grants:
+            if not isinstance(grant, dict):
+                raise RuleError("invalid", "grant must be a dict")
+            gpid = grant.get("pid", pid)
+            if not isinstance(gpid, int) or gpid < 0 or gpid >= len(g.players):
+                raise RuleError("invalid", "Bad player id", {"pid": gpid})
+            gres = grant.get("res", {})
+            if not isinstance(gres, dict):
+                raise RuleError("invalid", "grant res must be a dict")
+            for r, n in gres.items():
+                if r not in RESOURCES:
+                    continue
+                qty = int(n)
+                if qty <= 0:
+                    continue
+                bulk_grants.append((gpid, r, qty))
+                bulk_need[r] = bulk_need.get(r, 0) + qty
+        for r, qty in bulk_need.items():
+            if g.bank.get(r, 0) < qty:
+                raise RuleError("illegal", f"Bank lacks {r}")
+        for gpid, r, qty in bulk_grants:
+            g.bank[r] -= qty
+            g.players[gpid].res[r] += qty
+        return g, events
+
     if ctype == "place_settlement":
         vid = int(cmd.get("vid"))
         setup = bool(cmd.get("setup", False)) or g.phase == "setup"
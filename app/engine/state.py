@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple, Set
 
 
 RESOURCES = ["wood", "brick", "sheep", "wheat", "ore"]
+RES_IDX = {r: i for i, r in enumerate(RESOURCES)}
 
 TERRAIN_TO_RES = {
     "forest": "wood",
@@ -16,6 +17,8 @@ TERRAIN_TO_RES = {
     "gold": None,
     "sea": None,
 }
+# terrain -> RES_IDX position, only for producing terrains
+TERRAIN_RES_IDX = {t: RES_IDX[r] for t, r in TERRAIN_TO_RES.items() if r}
 
 COST = {
     "road": {"wood": 1, "brick": 1},
@@ -42,6 +45,9 @@ class TradeOffer:
 
 @dataclass
 class Tile:
+    # no field defaults, so plain __slots__ works without dataclass(slots=True) (3.10+)
+    __slots__ = ("q", "r", "terrain", "number", "center")
+
     q: int
     r: int
     terrain: str
@@ -58,6 +64,10 @@ class PlayerState:
     knights_played: int = 0
     dev_cards: List[dict] = field(default_factory=list)
 
+    @property
+    def hand_size(self) -> int:
+        return sum(self.res.values())
+
 
 @dataclass
 class AchievementState:
@@ -92,6 +102,36 @@ class BoardState:
     occupied_v: Dict[int, Tuple[int, int]] = field(default_factory=dict)
     occupied_e: Dict[Tuple[int, int], int] = field(default_factory=dict)
     occupied_ships: Dict[Tuple[int, int], int] = field(default_factory=dict)
+    _tile_vertices: Optional[Tuple[Dict[int, List[int]], Dict[int, List[int]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _vertex_edges: Optional[Tuple[Set[Tuple[int, int]], int, Dict[int, List[Tuple[int, int]]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def tile_vertices(self, ti: int) -> List[int]:
+        # inverse of vertex_adj_hexes, built lazily and rebuilt if that mapping is replaced
+        cached = self._tile_vertices
+        if cached is None or cached[0] is not self.vertex_adj_hexes:
+            inv: Dict[int, List[int]] = {}
+            for vid, tis in self.vertex_adj_hexes.items():
+                for t in tis:
+                    inv.setdefault(t, []).append(vid)
+            cached = (self.vertex_adj_hexes, inv)
+            self._tile_vertices = cached
+        return cached[1].get(ti, [])
+
+    def vertex_edges(self, vid: int) -> List[Tuple[int, int]]:
+        # edges incident to vid; rebuilt if the edge set is replaced or grows
+        cached = self._vertex_edges
+        if cached is None or cached[0] is not self.edges or cached[1] != len(self.edges):
+            inc: Dict[int, List[Tuple[int, int]]] = {}
+            for e in self.edges:
+                inc.setdefault(e[0], []).append(e)
+                inc.setdefault(e[1], []).append(e)
+            cached = (self.edges, len(self.edges), inc)
+            self._vertex_edges = cached
+        return cached[2].get(vid, [])
 
 
 @dataclass
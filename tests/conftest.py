@@ -0,0 +1,25 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    # imported here so the engine/harness tests still collect without PySide6
+    from PySide6 import QtWidgets
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def main_window(qapp):
+    from app import ui_v6
+    from app.config import GameConfig
+
+    win = ui_v6.MainWindow(config=GameConfig(), on_back_to_menu=None)
+    win.show()
+    yield win
+    win.close()
+    qapp.processEvents()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import pickle
 import random
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from app.engine import rules as engine_rules
 from app.engine.state import RESOURCES
@@ -15,14 +16,35 @@ class ScenarioFailure(Exception):
         self.details = details or {}
 
 
+# Stays a plain dict for reports/failure details; ``ok`` is mirrored as a slot attribute.
+class ActionResult(dict):
+    __slots__ = ("ok",)
+
+    def __init__(self, ok: bool, **payload: Any):
+        super().__init__(ok=ok, **payload)
+        self.ok = ok
+
+
+# seed -> pickled default game; every scenario starts from the same seed-built board
+_PRISTINE: Dict[int, bytes] = {}
+
+
+def _pristine_game(seed: int):
+    blob = _PRISTINE.get(seed)
+    if blob is None:
+        game = engine_rules.build_game(seed=seed, max_players=2, size=62.0)
+        blob = _PRISTINE[seed] = pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL)
+    return pickle.loads(blob)
+
+
 class GameDriver:
     def __init__(self, seed: int):
         self.seed = int(seed)
         self.rng = random.Random(self.seed)
-        self.game = engine_rules.build_game(seed=self.seed, max_players=2, size=62.0)
+        self.game = _pristine_game(self.seed)
         self.logs: List[str] = []
         self.steps: List[Dict[str, Any]] = []
-        self.on_step: Optional[Callable[["GameDriver", Dict[str, Any], Dict[str, Any]], None]] = None
+        self.on_step: Optional[Callable[["GameDriver", Dict[str, Any], ActionResult], None]] = None
         self.expected_totals = self._compute_resource_totals()
 
     def _log(self, msg: str) -> None:
@@ -60,20 +82,39 @@ class GameDriver:
     def fail(self, message: str, kind: str = "assertion", details: Optional[Dict[str, Any]] = None) -> None:
         raise ScenarioFailure(message, kind=kind, details=details)
 
-    def do(self, action: Dict[str, Any]) -> Dict[str, Any]:
+    def do(self, action: Dict[str, Any]) -> ActionResult:
+        # apply_action treats ``action`` as read-only, so it is recorded as-is
         result = self.apply_action(action)
-        self.steps.append(dict(action))
+        self.steps.append(action)
         if self.on_step:
             self.on_step(self, action, result)
         return result
 
+    def roll(self, pid: int, value: int) -> ActionResult:
+        return self.do({"type": "roll", "pid": pid, "roll": value})
+
+    # for actions a scenario expects to be rejected: recorded, but on_step is not run
+    def attempt(self, action: Dict[str, Any]) -> ActionResult:
+        result = self.apply_action(action)
+        self.steps.append(action)
+        return result
+
+    def can_place_settlement(self, pid: int, vid: int, require_road: bool) -> bool:
+        return engine_rules.can_place_settlement(self.game, pid, vid, require_road=require_road)
+
     def legal_settlement_vertices(self, pid: int, require_road: bool) -> List[int]:
         out = []
         for vid in self.game.vertices.keys():
-            if engine_rules.can_place_settlement(self.game, pid, vid, require_road=require_road):
+            if self.can_place_settlement(pid, vid, require_road):
                 out.append(vid)
         return out
 
+    def first_legal_settlement_vertex(self, pid: int, require_road: bool) -> Optional[int]:
+        for vid in self.game.vertices.keys():
+            if self.can_place_settlement(pid, vid, require_road):
+                return vid
+        return None
+
     def legal_city_vertices(self, pid: int) -> List[int]:
         out = []
         for vid in self.game.vertices.keys():
@@ -88,32 +129,52 @@ class GameDriver:
                 out.append(e)
         return out
 
-    def apply_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
+    def first_legal_road_edge(self, pid: int, must_touch_vid: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        for e in self.game.edges:
+            if engine_rules.can_place_road(self.game, pid, e, must_touch_vid=must_touch_vid):
+                return e
+        return None
+
+    def legal_ship_edges(self, pid: int, candidates: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        # a ship must touch the player's network, so only edges at those vertices reach can_place_ship
+        g = self.game
+        net = {vid for vid, (owner, _lvl) in g.occupied_v.items() if owner == pid}
+        for pieces in (g.occupied_e, g.occupied_ships):
+            for e, owner in pieces.items():
+                if owner == pid:
+                    net.update(e)
+        return sorted(
+            e for e in candidates
+            if (e[0] in net or e[1] in net) and engine_rules.can_place_ship(g, pid, e)
+        )
+
+    def apply_action(self, action: Dict[str, Any]) -> ActionResult:
         g = self.game
         try:
             pid = int(action.get("pid", g.turn))
             _, events = engine_rules.apply_cmd(g, pid, action)
-            result: Dict[str, Any] = {"ok": True}
+            result = ActionResult(True)
             for ev in events:
-                if ev.get("type") == "trade_bank":
+                etype = ev.get("type")
+                if etype == "trade_bank":
                     result["rate"] = ev.get("rate")
-                if ev.get("type") == "buy_dev":
+                elif etype == "buy_dev":
                     result["card"] = ev.get("card")
-                if ev.get("type") == "play_dev":
+                elif etype == "play_dev":
                     result["result"] = ev.get("result")
-                if ev.get("type") == "roll" and ev.get("pending"):
+                elif etype == "roll" and ev.get("pending"):
                     result["pending"] = ev.get("pending")
             return result
         except engine_rules.RuleError as exc:
-            return {
-                "ok": False,
-                "error": exc.code,
-                "message": exc.message,
-                "details": exc.details,
-            }
+            return ActionResult(
+                False,
+                error=exc.code,
+                message=exc.message,
+                details=exc.details,
+            )
         except Exception as exc:
-            return {
-                "ok": False,
-                "error": str(exc),
-                "exception": traceback.format_exc(),
-            }
+            return ActionResult(
+                False,
+                error=str(exc),
+                exception=traceback.format_exc(),
+            )
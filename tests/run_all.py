@@ -12,7 +12,7 @@ from typing import Any, Dict, List
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 os.environ.setdefault("CATAN_TEST_MODE", "1")
 
-from tests.harness.engine import GameDriver, ScenarioFailure
+from tests.harness.engine import ActionResult, GameDriver, ScenarioFailure
 from tests.harness.invariants import check_invariants
 
 DEFAULT_SEEDS = list(range(1, 21))
@@ -46,6 +46,8 @@ def _severity(kind: str) -> str:
 
 def _write_bug_report(path: Path, failures: List[Dict[str, Any]]) -> None:
     lines = ["# BUG_REPORT", ""]
+    # json.dumps(sort_keys=True) builds a new encoder per call; reuse one for every step
+    step_encoder = json.JSONEncoder(sort_keys=True)
     if not failures:
         lines.append("No failures detected.")
         path.write_text("\n".join(lines), encoding="utf-8")
@@ -62,7 +64,7 @@ def _write_bug_report(path: Path, failures: List[Dict[str, Any]]) -> None:
         lines.append("```")
         lines.append(f"seed={f['seed']}")
         for step in f.get("steps", []):
-            lines.append(json.dumps(step, sort_keys=True))
+            lines.append(step_encoder.encode(step))
         lines.append("```")
         lines.append("")
         lines.append("Expected vs Actual:")
@@ -107,8 +109,8 @@ def main() -> int:
         for seed in seeds:
             driver = GameDriver(seed)
 
-            def on_step(drv: GameDriver, action: Dict[str, Any], result: Dict[str, Any]):
-                if not result.get("ok", False):
+            def on_step(drv: GameDriver, action: Dict[str, Any], result: ActionResult):
+                if not result.ok:
                     raise ScenarioFailure("action failed", kind="rule", details={"action": action, "result": result})
                 inv = check_invariants(drv.game, drv.expected_totals)
                 if inv:
@@ -12,13 +12,33 @@ from tests.harness.invariants import check_invariants
 
 SEEDS = list(range(1, 6))
 
+# Qt widgets are expensive to build; keep one app/window for all seeds.
+_APP = None
+_WINDOW = None
 
-def run(driver: GameDriver) -> Dict[str, Any]:
+
+def _get_window() -> ui_v6.MainWindow:
+    global _APP, _WINDOW
     os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    if _APP is None:
+        _APP = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    if _WINDOW is None:
+        _WINDOW = ui_v6.MainWindow(config=GameConfig(bot_enabled=True, bot_difficulty=1))
+        _WINDOW.hide()
+    else:
+        _WINDOW._restart_game()
+    return _WINDOW
+
 
-    w = ui_v6.MainWindow(config=GameConfig(bot_enabled=True, bot_difficulty=1))
-    w.hide()
+def _close_window() -> None:
+    global _WINDOW
+    if _WINDOW is not None:
+        _WINDOW.close()
+        _WINDOW = None
+
+
+def run(driver: GameDriver) -> Dict[str, Any]:
+    w = _get_window()
     g = w.game
     driver.replace_game(g)
 
@@ -28,20 +48,22 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.rolled = False
 
     steps = []
-    for i in range(50):
-        w._bot_turn()
-        step = {"type": "bot_turn", "turn": i}
-        steps.append(step)
-        driver.steps.append(dict(step))
-        failures = check_invariants(g, driver.expected_totals)
-        if failures:
-            driver.fail("invariants failed during bot run", kind="invariant", details={"failures": failures})
-        # force next bot turn
-        g.turn = 1
-        g.rolled = False
-        g.pending_action = None
-
-    w.close()
+    try:
+        for i in range(50):
+            w._bot_turn()
+            step = {"type": "bot_turn", "turn": i}
+            steps.append(step)
+            driver.steps.append(step)
+            failures = check_invariants(g, driver.expected_totals)
+            if failures:
+                driver.fail("invariants failed during bot run", kind="invariant", details={"failures": failures})
+            # force next bot turn
+            g.turn = 1
+            g.rolled = False
+            g.pending_action = None
+    finally:
+        if driver.seed == SEEDS[-1]:
+            _close_window()
 
     return {
         "steps": steps,
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict
 
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import end_turn, grant_resources, play_dev
 
 
 def run(driver: GameDriver) -> Dict[str, Any]:
@@ -15,49 +16,46 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.dev_deck = ["knight", "victory_point"]
 
     # buy VP card and ensure VP increments
-    driver.do({"type": "grant_resources", "pid": 0, "res": {"sheep": 1, "wheat": 1, "ore": 1}})
+    driver.do(grant_resources(0, {"sheep": 1, "wheat": 1, "ore": 1}))
     res = driver.do({"type": "buy_dev", "pid": 0})
-    if not res.get("ok"):
+    if not res.ok:
         driver.fail("buy dev failed", kind="assertion", details=res)
     if g.players[0].vp < 1:
         driver.fail("victory point dev did not add VP", kind="assertion")
 
     # cannot play VP card
-    action = {"type": "play_dev", "pid": 0, "card": "victory_point"}
-    driver.steps.append(dict(action))
-    res = driver.apply_action(action)
-    if res.get("ok"):
+    action = play_dev(0, "victory_point")
+    res = driver.attempt(action)
+    if res.ok:
         driver.fail("victory point dev should not be playable", kind="assertion")
 
     # buy knight (new) and try to play same turn
-    driver.do({"type": "grant_resources", "pid": 0, "res": {"sheep": 1, "wheat": 1, "ore": 1}})
+    driver.do(grant_resources(0, {"sheep": 1, "wheat": 1, "ore": 1}))
     res = driver.do({"type": "buy_dev", "pid": 0})
-    if not res.get("ok"):
+    if not res.ok:
         driver.fail("buy knight dev failed", kind="assertion", details=res)
 
-    action = {"type": "play_dev", "pid": 0, "card": "knight"}
-    driver.steps.append(dict(action))
-    res = driver.apply_action(action)
-    if res.get("ok"):
+    action = play_dev(0, "knight")
+    res = driver.attempt(action)
+    if res.ok:
         driver.fail("new dev played on same turn", kind="assertion")
 
     # end turn to clear new flag
-    driver.do({"type": "end_turn", "pid": 0})
-    driver.do({"type": "end_turn", "pid": 1})
+    driver.do(end_turn(0))
+    driver.do(end_turn(1))
 
     # now play knight
-    res = driver.do({"type": "play_dev", "pid": 0, "card": "knight"})
-    if not res.get("ok"):
+    res = driver.do(play_dev(0, "knight"))
+    if not res.ok:
         driver.fail("playing knight failed after turn", kind="assertion", details=res)
     g.pending_action = None
     g.pending_pid = None
 
     # only one dev per turn
     g.players[0].dev_cards.append({"type": "monopoly", "new": False})
-    action = {"type": "play_dev", "pid": 0, "card": "monopoly", "res": "wood"}
-    driver.steps.append(dict(action))
-    res = driver.apply_action(action)
-    if res.get("ok"):
+    action = play_dev(0, "monopoly", res="wood")
+    res = driver.attempt(action)
+    if res.ok:
         driver.fail("multiple devs in a turn allowed", kind="assertion")
 
     return {
@@ -2,15 +2,15 @@
 
 from typing import Any, Dict
 
-from app.engine import rules as engine_rules
 from app.engine.state import TERRAIN_TO_RES
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import place_road, place_settlement
 
 
 def _pick_settlement_with_resources(driver: GameDriver, pid: int) -> int:
     g = driver.game
     for vid in g.vertices.keys():
-        if not engine_rules.can_place_settlement(g, pid, vid, require_road=False):
+        if not driver.can_place_settlement(pid, vid, require_road=False):
             continue
         tiles = g.vertex_adj_hexes.get(vid, [])
         for ti in tiles:
@@ -39,8 +39,8 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     pid0 = g.setup_order[g.setup_idx]
     vid1 = _pick_settlement_with_resources(driver, pid0)
     before = dict(g.players[pid0].res)
-    res = driver.do({"type": "place_settlement", "pid": pid0, "vid": vid1, "setup": True})
-    if not res.get("ok"):
+    res = driver.do(place_settlement(pid0, vid1, setup=True))
+    if not res.ok:
         driver.fail("first settlement failed", kind="assertion", details=res)
     after = dict(g.players[pid0].res)
     if after != before:
@@ -50,22 +50,22 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     edges = driver.legal_road_edges(pid0, must_touch_vid=vid1)
     if not edges:
         driver.fail("no legal road for first settlement", kind="assertion")
-    res = driver.do({"type": "place_road", "pid": pid0, "eid": edges[0], "setup": True})
-    if not res.get("ok"):
+    res = driver.do(place_road(pid0, edges[0], setup=True))
+    if not res.ok:
         driver.fail("first road failed", kind="assertion", details=res)
 
     # advance setup for pid1 twice
     for _ in range(2):
         pid = g.setup_order[g.setup_idx]
         vid = _pick_settlement_with_resources(driver, pid)
-        res = driver.do({"type": "place_settlement", "pid": pid, "vid": vid, "setup": True})
-        if not res.get("ok"):
+        res = driver.do(place_settlement(pid, vid, setup=True))
+        if not res.ok:
             driver.fail("setup settlement failed", kind="assertion", details=res)
         edges = driver.legal_road_edges(pid, must_touch_vid=vid)
         if not edges:
             driver.fail("no legal road in setup", kind="assertion")
-        res = driver.do({"type": "place_road", "pid": pid, "eid": edges[0], "setup": True})
-        if not res.get("ok"):
+        res = driver.do(place_road(pid, edges[0], setup=True))
+        if not res.ok:
             driver.fail("setup road failed", kind="assertion", details=res)
 
     # second settlement for pid0 should grant resources
@@ -83,17 +83,17 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.bank[shortage_res] = 0
     expected[shortage_res] = 0
 
-    before = dict(g.players[pid0].res)
-    bank_before = dict(g.bank)
-    res = driver.do({"type": "place_settlement", "pid": pid0, "vid": vid2, "setup": True})
-    if not res.get("ok"):
+    before = {r: g.players[pid0].res[r] for r in expected}
+    bank_before = {r: g.bank[r] for r in expected}
+    res = driver.do(place_settlement(pid0, vid2, setup=True))
+    if not res.ok:
         driver.fail("second settlement failed", kind="assertion", details=res)
 
     for r, qty in expected.items():
-        if g.players[pid0].res[r] != before.get(r, 0) + qty:
-            driver.fail("initial resources mismatch", kind="assertion", details={"res": r, "expected": before.get(r, 0) + qty, "actual": g.players[pid0].res[r]})
-        if g.bank[r] != bank_before.get(r, 0) - qty:
-            driver.fail("bank update mismatch", kind="assertion", details={"res": r, "expected": bank_before.get(r, 0) - qty, "actual": g.bank[r]})
+        if g.players[pid0].res[r] != before[r] + qty:
+            driver.fail("initial resources mismatch", kind="assertion", details={"res": r, "expected": before[r] + qty, "actual": g.players[pid0].res[r]})
+        if g.bank[r] != bank_before[r] - qty:
+            driver.fail("bank update mismatch", kind="assertion", details={"res": r, "expected": bank_before[r] - qty, "actual": g.bank[r]})
         if g.bank[r] < 0:
             driver.fail("bank went negative", kind="assertion", details={"res": r, "value": g.bank[r]})
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict
 
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import end_turn, play_dev
 
 
 def _add_knight(g, pid: int):
@@ -18,13 +19,13 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     # player 0 plays 3 knights across turns
     for _ in range(3):
         _add_knight(g, 0)
-        res = driver.do({"type": "play_dev", "pid": 0, "card": "knight"})
-        if not res.get("ok"):
+        res = driver.do(play_dev(0, "knight"))
+        if not res.ok:
             driver.fail("knight play failed", kind="assertion", details=res)
         g.pending_action = None
         g.pending_pid = None
-        driver.do({"type": "end_turn", "pid": 0})
-        driver.do({"type": "end_turn", "pid": 1})
+        driver.do(end_turn(0))
+        driver.do(end_turn(1))
 
     if g.largest_army_owner != 0 or g.largest_army_size < 3:
         driver.fail("largest army not awarded", kind="assertion", details={
@@ -37,13 +38,13 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.phase = "main"
     for _ in range(4):
         _add_knight(g, 1)
-        res = driver.do({"type": "play_dev", "pid": 1, "card": "knight"})
-        if not res.get("ok"):
+        res = driver.do(play_dev(1, "knight"))
+        if not res.ok:
             driver.fail("knight play failed p1", kind="assertion", details=res)
         g.pending_action = None
         g.pending_pid = None
-        driver.do({"type": "end_turn", "pid": 1})
-        driver.do({"type": "end_turn", "pid": 0})
+        driver.do(end_turn(1))
+        driver.do(end_turn(0))
 
     if g.largest_army_owner != 1:
         driver.fail("largest army did not transfer", kind="assertion", details={"owner": g.largest_army_owner})
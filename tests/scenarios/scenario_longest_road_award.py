@@ -4,15 +4,10 @@ from typing import Any, Dict, List, Tuple
 
 from app.engine import rules as engine_rules
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import build_edge_adj, grant_resources, place_road
 
 
-def _find_path_edges(g, start_vid: int, length: int) -> List[Tuple[int, int]]:
-    adj: Dict[int, List[Tuple[int, int]]] = {}
-    for e in g.edges:
-        a, b = e
-        adj.setdefault(a, []).append(e)
-        adj.setdefault(b, []).append(e)
-
+def _find_path_edges(adj: Dict[int, List[Tuple[int, int]]], start_vid: int, length: int) -> List[Tuple[int, int]]:
     def dfs(v: int, used: set, remaining: int) -> List[Tuple[int, int]]:
         if remaining == 0:
             return []
@@ -34,24 +29,18 @@ def _find_path_edges(g, start_vid: int, length: int) -> List[Tuple[int, int]]:
     return res
 
 
-def _pick_isolated_vertex(g) -> int:
+def _build_neighbors(adj: Dict[int, List[Tuple[int, int]]]) -> Dict[int, List[int]]:
+    return {v: [b if a == v else a for a, b in edges] for v, edges in adj.items()}
+
+
+def _pick_isolated_vertex(g, adj: Dict[int, List[Tuple[int, int]]], neighbors: Dict[int, List[int]]) -> int:
     for vid in g.vertices.keys():
         if vid in g.occupied_v:
             continue
         # avoid vertices on existing roads
-        blocked = False
-        for e in g.occupied_e.keys():
-            if vid in e:
-                blocked = True
-                break
-        if blocked:
+        if any(e in g.occupied_e for e in adj.get(vid, [])):
             continue
-        ok = True
-        for nb in engine_rules.edge_neighbors_of_vertex(g.edges, vid):
-            if nb in g.occupied_v:
-                ok = False
-                break
-        if ok:
+        if not any(nb in g.occupied_v for nb in neighbors.get(vid, [])):
             return vid
     raise ValueError("no isolated vertex")
 
@@ -62,20 +51,23 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.turn = 0
     g.rolled = True
 
+    adj = build_edge_adj(g)
+    neighbors = _build_neighbors(adj)
+
     # place a settlement for player 0 to anchor roads
-    start = _pick_isolated_vertex(g)
+    start = _pick_isolated_vertex(g, adj, neighbors)
     g.occupied_v[start] = (0, 1)
     g.players[0].vp += 1
     engine_rules.update_longest_road(g)
 
-    path = _find_path_edges(g, start, 5)
+    path = _find_path_edges(adj, start, 5)
     if len(path) < 5:
         driver.fail("could not find road path length 5", kind="assertion")
 
-    driver.do({"type": "grant_resources", "pid": 0, "res": {"wood": 5, "brick": 5}})
+    driver.do(grant_resources(0, {"wood": 5, "brick": 5}))
     for e in path:
-        res = driver.do({"type": "place_road", "pid": 0, "eid": e})
-        if not res.get("ok"):
+        res = driver.do(place_road(0, e))
+        if not res.ok:
             driver.fail("place road failed", kind="assertion", details=res)
 
     if g.longest_road_owner != 0 or g.longest_road_len < 5:
@@ -86,19 +78,19 @@ def run(driver: GameDriver) -> Dict[str, Any]:
 
     # build longer road for player 1
     g.turn = 1
-    start2 = _pick_isolated_vertex(g)
+    start2 = _pick_isolated_vertex(g, adj, neighbors)
     g.occupied_v[start2] = (1, 1)
     g.players[1].vp += 1
     engine_rules.update_longest_road(g)
 
-    path2 = _find_path_edges(g, start2, 6)
+    path2 = _find_path_edges(adj, start2, 6)
     if len(path2) < 6:
         driver.fail("could not find road path length 6", kind="assertion")
 
-    driver.do({"type": "grant_resources", "pid": 1, "res": {"wood": 6, "brick": 6}})
+    driver.do(grant_resources(1, {"wood": 6, "brick": 6}))
     for e in path2:
-        res = driver.do({"type": "place_road", "pid": 1, "eid": e})
-        if not res.get("ok"):
+        res = driver.do(place_road(1, e))
+        if not res.ok:
             driver.fail("place road failed for p1", kind="assertion", details=res)
 
     if g.longest_road_owner != 1:
@@ -111,12 +103,7 @@ def run(driver: GameDriver) -> Dict[str, Any]:
         for vid in e:
             if vid in g.occupied_v:
                 continue
-            ok = True
-            for nb in engine_rules.edge_neighbors_of_vertex(g.edges, vid):
-                if nb in g.occupied_v:
-                    ok = False
-                    break
-            if ok:
+            if not any(nb in g.occupied_v for nb in neighbors.get(vid, [])):
                 blocker = vid
                 break
         if blocker is not None:
@@ -4,15 +4,10 @@ from typing import Any, Dict, List, Tuple
 
 from app.engine import rules as engine_rules
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import build_edge_adj
 
 
-def _find_edge_path(g, min_len: int) -> tuple[list[Tuple[int, int]], list[int]] | None:
-    edges = list(g.edges)
-    adj: Dict[int, List[Tuple[int, int]]] = {}
-    for a, b in edges:
-        adj.setdefault(a, []).append((a, b))
-        adj.setdefault(b, []).append((a, b))
-
+def _find_edge_path(adj: Dict[int, List[Tuple[int, int]]], min_len: int) -> tuple[list[Tuple[int, int]], list[int]] | None:
     def dfs(v: int, used: set, verts: List[int], path: List[Tuple[int, int]]):
         if len(path) >= min_len:
             return path, verts
@@ -45,7 +40,8 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.occupied_v.clear()
     g.occupied_e.clear()
 
-    found = _find_edge_path(g, 6) or _find_edge_path(g, 5)
+    adj = build_edge_adj(g)
+    found = _find_edge_path(adj, 6) or _find_edge_path(adj, 5)
     if not found:
         driver.fail("no path found for longest road test", kind="assertion")
     path, verts = found
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import sys
 from typing import Any, Dict
 
 from app.engine import rules as engine_rules
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import grant_resources, place_settlement
 
 
 def run(driver: GameDriver) -> Dict[str, Any]:
@@ -12,18 +14,15 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     # place a settlement on a port endpoint (setup rules)
     port_vid = None
     port_kind = None
-    for edge, kind in g.ports:
-        for vid in edge:
-            if not engine_rules.can_place_settlement(g, 0, vid, require_road=False):
-                continue
-            g.setup_need = "settlement"
-            g.phase = "setup"
-            res = driver.do({"type": "place_settlement", "pid": 0, "vid": vid, "setup": True})
-            if res.get("ok"):
-                port_vid = vid
-                port_kind = kind
-                break
-        if port_vid is not None:
+    for vid, kind in engine_rules.port_vertices(g).items():
+        if not driver.can_place_settlement(0, vid, require_road=False):
+            continue
+        g.setup_need = "settlement"
+        g.phase = "setup"
+        res = driver.do(place_settlement(0, vid, setup=True))
+        if res.ok:
+            port_vid = vid
+            port_kind = kind
             break
 
     if port_vid is None:
@@ -42,7 +41,7 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     if port_kind and "3:1" in port_kind:
         expected_rate = 3
     elif port_kind and "2:1:" in port_kind:
-        give_res = port_kind.split(":", 2)[2]
+        give_res = sys.intern(port_kind.split(":", 2)[2])
         expected_rate = 2
 
     rate = engine_rules.best_trade_rate(g, 0, give_res)
@@ -51,10 +50,10 @@ def run(driver: GameDriver) -> Dict[str, Any]:
 
     # fund and trade
     give_qty = rate * 1
-    driver.do({"type": "grant_resources", "pid": 0, "res": {give_res: give_qty}})
+    driver.do(grant_resources(0, {give_res: give_qty}))
     before_bank = g.bank.copy()
     res = driver.do({"type": "trade_bank", "pid": 0, "give": give_res, "get": "brick", "get_qty": 1})
-    if not res.get("ok"):
+    if not res.ok:
         driver.fail("trade failed", kind="assertion", details=res)
 
     if g.bank[give_res] != before_bank[give_res] + give_qty:
@@ -2,9 +2,16 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from app.engine.state import TERRAIN_TO_RES
+from app.engine.state import RESOURCES, TERRAIN_RES_IDX
 from tests.harness.engine import GameDriver
-from tests.scenarios.utils import run_setup_snake
+from tests.scenarios.utils import (
+    discard_need,
+    grant_resources_bulk,
+    plan_discard,
+    run_setup_snake,
+    snapshot_hands,
+    vids_by_owner,
+)
 
 
 def run(driver: GameDriver) -> Dict[str, Any]:
@@ -16,37 +23,22 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.rolled = False
 
     # grant resources to force discard
-    driver.do({"type": "grant_resources", "pid": 0, "res": {"wood": 4, "brick": 4}})
-    driver.do({"type": "grant_resources", "pid": 1, "res": {"wheat": 4, "sheep": 4}})
+    driver.do(grant_resources_bulk({0: {"wood": 4, "brick": 4}, 1: {"wheat": 4, "sheep": 4}}))
 
-    before_sizes = [sum(p.res.values()) for p in g.players]
-    res = driver.do({"type": "roll", "pid": 0, "roll": 7})
-    if not res.get("ok"):
+    needs = [discard_need(p.hand_size) for p in g.players]
+    res = driver.roll(0, 7)
+    if not res.ok:
         driver.fail("roll 7 failed", kind="assertion", details=res)
 
     if g.pending_action != "discard":
         driver.fail("discard should be pending after roll 7", kind="assertion", details={"pending": g.pending_action})
 
-    def _plan_discard(pid: int, need: int) -> Dict[str, int]:
-        pres = g.players[pid].res
-        plan = {r: 0 for r in pres.keys()}
-        remaining = need
-        for r in sorted(pres.keys()):
-            if remaining <= 0:
-                break
-            take = min(pres[r], remaining)
-            if take > 0:
-                plan[r] = take
-                remaining -= take
-        return plan
-
-    for pid in range(len(g.players)):
-        need = before_sizes[pid] // 2 if before_sizes[pid] > 7 else 0
+    for pid, need in enumerate(needs):
         if need <= 0:
             continue
-        discards = _plan_discard(pid, need)
+        discards = plan_discard(g.players[pid].res, need)
         res = driver.do({"type": "discard", "pid": pid, "discards": discards})
-        if not res.get("ok"):
+        if not res.ok:
             driver.fail("discard failed", kind="assertion", details=res)
 
     if g.pending_action != "robber_move":
@@ -54,9 +46,7 @@ def run(driver: GameDriver) -> Dict[str, Any]:
 
     # pick a tile adjacent to player 1 to test stealing
     target_tile = None
-    for vid, (owner, _lvl) in g.occupied_v.items():
-        if owner != 1:
-            continue
+    for vid in vids_by_owner(g)[1]:
         for ti in g.vertex_adj_hexes.get(vid, []):
             if ti != g.robber_tile:
                 target_tile = ti
@@ -66,16 +56,16 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     if target_tile is None:
         driver.fail("no victim tile for robber", kind="assertion")
 
-    before_p0 = g.players[0].res.copy()
-    before_p1 = g.players[1].res.copy()
+    before_p0 = g.players[0].hand_size
+    before_p1 = g.players[1].hand_size
     res = driver.do({"type": "move_robber", "pid": 0, "tile": target_tile, "victim": 1})
-    if not res.get("ok"):
+    if not res.ok:
         driver.fail("move robber failed", kind="assertion", details=res)
 
     # verify one resource moved if victim had any
-    if sum(before_p1.values()) > 0:
-        delta_p0 = sum(g.players[0].res.values()) - sum(before_p0.values())
-        delta_p1 = sum(g.players[1].res.values()) - sum(before_p1.values())
+    if before_p1 > 0:
+        delta_p0 = g.players[0].hand_size - before_p0
+        delta_p1 = g.players[1].hand_size - before_p1
         if not (delta_p0 == 1 and delta_p1 == -1):
             driver.fail("robber steal mismatch", kind="assertion", details={
                 "delta_p0": delta_p0,
@@ -87,24 +77,26 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     if roll is not None:
         g.rolled = False
         g.last_roll = None
-        before = [p.res.copy() for p in g.players]
-        res = driver.do({"type": "roll", "pid": 0, "roll": int(roll)})
-        if not res.get("ok"):
+        before = snapshot_hands(g)
+        res = driver.roll(0, int(roll))
+        if not res.ok:
             driver.fail("roll after robber failed", kind="assertion", details=res)
         # any adjacent settlements on that tile should not gain
-        for vid, (owner, level) in g.occupied_v.items():
-            if target_tile not in g.vertex_adj_hexes.get(vid, []):
-                continue
-            res_name = TERRAIN_TO_RES.get(g.tiles[target_tile].terrain)
-            if not res_name:
-                continue
-            if g.players[owner].res[res_name] != before[owner][res_name]:
-                driver.fail("robber did not block production", kind="assertion", details={
-                    "pid": owner,
-                    "res": res_name,
-                    "before": before[owner][res_name],
-                    "after": g.players[owner].res[res_name],
-                })
+        ri = TERRAIN_RES_IDX.get(g.tiles[target_tile].terrain)
+        if ri is not None:
+            res_name = RESOURCES[ri]
+            for vid in g.board.tile_vertices(target_tile):
+                occ = g.occupied_v.get(vid)
+                if occ is None:
+                    continue
+                owner = occ[0]
+                if g.players[owner].res[res_name] != before[owner][ri]:
+                    driver.fail("robber did not block production", kind="assertion", details={
+                        "pid": owner,
+                        "res": res_name,
+                        "before": before[owner][ri],
+                        "after": g.players[owner].res[res_name],
+                    })
 
     return {
         "steps": driver.steps,
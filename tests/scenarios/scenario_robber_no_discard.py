@@ -16,11 +16,11 @@ def run(driver: GameDriver) -> Dict[str, Any]:
 
     # ensure hands are <= 7 (no discard)
     for pid, p in enumerate(g.players):
-        if sum(p.res.values()) > 7:
-            driver.fail("unexpected hand >7 before roll 7", kind="assertion", details={"pid": pid, "hand": sum(p.res.values())})
+        if p.hand_size > 7:
+            driver.fail("unexpected hand >7 before roll 7", kind="assertion", details={"pid": pid, "hand": p.hand_size})
 
-    res = driver.do({"type": "roll", "pid": 0, "roll": 7})
-    if not res.get("ok"):
+    res = driver.roll(0, 7)
+    if not res.ok:
         driver.fail("roll 7 failed", kind="assertion", details=res)
 
     if g.pending_action != "robber_move":
@@ -31,7 +31,7 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     # move robber and ensure pending cleared
     target = 1 if g.robber_tile != 1 else 0
     res = driver.do({"type": "move_robber", "pid": 0, "tile": target})
-    if not res.get("ok"):
+    if not res.ok:
         driver.fail("move_robber failed", kind="assertion", details=res)
     if g.pending_action is not None:
         driver.fail("pending_action not cleared after move_robber", kind="assertion")
@@ -1,10 +1,30 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from app.engine.state import RESOURCES, TERRAIN_TO_RES
+from app.engine.state import RESOURCES, TERRAIN_RES_IDX
 from tests.harness.engine import GameDriver
-from tests.scenarios.utils import run_setup_snake
+from tests.scenarios.utils import run_setup_snake, snapshot_hands
+
+
+def _expected_gains(g, roll: int) -> List[List[int]]:
+    producing: Dict[int, int] = {}
+    for ti, tile in enumerate(g.tiles):
+        if tile.number != roll or ti == g.robber_tile:
+            continue
+        ri = TERRAIN_RES_IDX.get(tile.terrain)
+        if ri is not None:
+            producing[ti] = ri
+    gains = [[0] * len(RESOURCES) for _ in g.players]
+    if not producing:
+        return gains
+    vertex_adj_hexes = g.vertex_adj_hexes
+    for vid, (owner, level) in g.occupied_v.items():
+        for ti in vertex_adj_hexes.get(vid, ()):
+            ri = producing.get(ti)
+            if ri is not None:
+                gains[owner][ri] += 2 if level == 2 else 1
+    return gains
 
 
 def run(driver: GameDriver) -> Dict[str, Any]:
@@ -25,29 +45,18 @@ def run(driver: GameDriver) -> Dict[str, Any]:
         driver.fail("no numbered tiles", kind="assertion")
 
     # record pre-roll resources
-    before = [p.res.copy() for p in g.players]
+    before = snapshot_hands(g)
 
-    res = driver.do({"type": "roll", "pid": 0, "roll": roll})
-    if not res.get("ok"):
+    res = driver.roll(0, roll)
+    if not res.ok:
         driver.fail("roll failed", kind="assertion", details=res)
 
     # compute expected gains from all tiles with number
-    gains = [{r: 0 for r in RESOURCES} for _ in g.players]
-    for vid, (owner, level) in g.occupied_v.items():
-        for ti in g.vertex_adj_hexes.get(vid, []):
-            tile = g.tiles[ti]
-            if tile.number != roll:
-                continue
-            if ti == g.robber_tile:
-                continue
-            res_name = TERRAIN_TO_RES.get(tile.terrain)
-            if not res_name:
-                continue
-            gains[owner][res_name] += 2 if level == 2 else 1
+    gains = _expected_gains(g, roll)
 
     for pid, p in enumerate(g.players):
-        for r in RESOURCES:
-            expected = before[pid][r] + gains[pid][r]
+        for i, r in enumerate(RESOURCES):
+            expected = before[pid][i] + gains[pid][i]
             actual = p.res[r]
             if actual != expected:
                 driver.fail("resource distribution mismatch", kind="assertion", details={
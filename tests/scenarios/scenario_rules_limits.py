@@ -3,7 +3,7 @@ from __future__ import annotations
 from app.engine import maps as map_loader
 from app.engine import rules as engine_rules
 from tests.harness.engine import GameDriver
-from tests.scenarios.utils import run_setup_snake
+from tests.scenarios.utils import grant_resources, place_road, run_setup_snake
 
 
 def run(driver: GameDriver):
@@ -21,28 +21,26 @@ def run(driver: GameDriver):
     g.turn = 0
 
     # road limit should be reached after setup (2 roads)
-    driver.do({"type": "grant_resources", "pid": 0, "res": {"wood": 1, "brick": 1}})
+    driver.do(grant_resources(0, {"wood": 1, "brick": 1}))
     edges = driver.legal_road_edges(0)
     if not edges:
         driver.fail("no legal road edge to test limit", kind="assertion")
-    action = {"type": "place_road", "pid": 0, "eid": edges[0]}
-    res = driver.apply_action(action)
-    driver.steps.append(dict(action))
-    if res.get("ok", True):
+    action = place_road(0, edges[0])
+    res = driver.attempt(action)
+    if res.ok:
         driver.fail("road limit not enforced", kind="assertion")
 
     # city limit: allow first upgrade, block second
-    driver.do({"type": "grant_resources", "pid": 0, "res": {"wheat": 4, "ore": 6}})
+    driver.do(grant_resources(0, {"wheat": 4, "ore": 6}))
     settlements = [vid for vid, (owner, level) in g.occupied_v.items() if owner == 0 and level == 1]
     if len(settlements) < 2:
         driver.fail("not enough settlements for city limit test", kind="assertion")
     res1 = driver.do({"type": "upgrade_city", "pid": 0, "vid": settlements[0]})
-    if not res1.get("ok", False):
+    if not res1.ok:
         driver.fail("first city upgrade failed", kind="assertion", details=res1)
     action = {"type": "upgrade_city", "pid": 0, "vid": settlements[1]}
-    res2 = driver.apply_action(action)
-    driver.steps.append(dict(action))
-    if res2.get("ok", True):
+    res2 = driver.attempt(action)
+    if res2.ok:
         driver.fail("city limit not enforced", kind="assertion")
 
     return {"summary": driver.snapshot(), "steps": driver.steps}
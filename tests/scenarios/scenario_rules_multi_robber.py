@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import pickle
+
 from app.engine import rules as engine_rules
 from app.engine import to_dict, from_dict
 from app.engine.state import TERRAIN_TO_RES
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import place_settlement
 
 
 def _find_vertex_with_unique_roll(g, pid: int):
@@ -37,7 +40,7 @@ def run(driver: GameDriver):
         driver.fail("no suitable vertex for multi-robber test", kind="assertion")
     vid, tile, roll, res = found
 
-    driver.do({"type": "place_settlement", "pid": 0, "vid": vid, "setup": True})
+    driver.do(place_settlement(0, vid, setup=True))
     g.phase = "main"
     g.turn = 0
     g.rolled = False
@@ -47,7 +50,7 @@ def run(driver: GameDriver):
     g.robbers = [other_tile, tile]
 
     before = int(g.players[0].res.get(res, 0))
-    driver.do({"type": "roll", "pid": 0, "roll": int(roll)})
+    driver.roll(0, int(roll))
     after = int(g.players[0].res.get(res, 0))
     if after != before:
         driver.fail("robber did not block resources from secondary robber", kind="assertion", details={"before": before, "after": after})
@@ -56,5 +59,9 @@ def run(driver: GameDriver):
     g2 = from_dict(snapshot)
     if len(getattr(g2, "robbers", [])) != 2:
         driver.fail("robbers not preserved in serialization", kind="assertion")
+    # the harness caches games as pickles, so the in-process round-trip must keep them too
+    g3 = pickle.loads(pickle.dumps(g, protocol=pickle.HIGHEST_PROTOCOL))
+    if g3.robbers != g.robbers:
+        driver.fail("robbers not preserved by pickle round-trip", kind="assertion")
 
     return {"summary": driver.snapshot(), "steps": driver.steps}
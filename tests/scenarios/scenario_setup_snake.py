@@ -3,26 +3,25 @@ from __future__ import annotations
 from typing import Any, Dict
 
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import place_road, place_settlement
 
 
 def run(driver: GameDriver) -> Dict[str, Any]:
     g = driver.game
     for pid in g.setup_order:
-        legal = driver.legal_settlement_vertices(pid, require_road=False)
-        if not legal:
+        chosen_vid = driver.first_legal_settlement_vertex(pid, require_road=False)
+        if chosen_vid is None:
             driver.fail("no legal settlement in setup", kind="assertion")
-        chosen_vid = legal[0]
 
-        res = driver.do({"type": "place_settlement", "pid": pid, "vid": chosen_vid, "setup": True})
-        if not res.get("ok"):
+        res = driver.do(place_settlement(pid, chosen_vid, setup=True))
+        if not res.ok:
             driver.fail("setup settlement failed", kind="assertion", details=res)
 
-        edges = driver.legal_road_edges(pid, must_touch_vid=chosen_vid)
-        if not edges:
+        road = driver.first_legal_road_edge(pid, must_touch_vid=chosen_vid)
+        if road is None:
             driver.fail("no legal road in setup", kind="assertion")
-        road = edges[0]
-        res = driver.do({"type": "place_road", "pid": pid, "eid": road, "setup": True})
-        if not res.get("ok"):
+        res = driver.do(place_road(pid, road, setup=True))
+        if not res.ok:
             driver.fail("setup road failed", kind="assertion", details=res)
 
     if g.phase != "main":
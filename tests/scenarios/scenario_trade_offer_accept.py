@@ -3,6 +3,12 @@
 from typing import Any, Dict
 
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import grant_resources
+
+# fixed actions, built once; the driver records them without mutating
+_FUND_P0 = grant_resources(0, {"wood": 2})
+_FUND_P1 = grant_resources(1, {"brick": 1})
+_OFFER = {"type": "trade_offer_create", "pid": 0, "give": {"wood": 2}, "get": {"brick": 1}, "to_pid": 1}
 
 
 def run(driver: GameDriver) -> Dict[str, Any]:
@@ -12,16 +18,16 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.rolled = True
 
     # fund players
-    driver.do({"type": "grant_resources", "pid": 0, "res": {"wood": 2}})
-    driver.do({"type": "grant_resources", "pid": 1, "res": {"brick": 1}})
+    driver.do(_FUND_P0)
+    driver.do(_FUND_P1)
 
-    res = driver.do({"type": "trade_offer_create", "pid": 0, "give": {"wood": 2}, "get": {"brick": 1}, "to_pid": 1})
-    if not res.get("ok"):
+    res = driver.do(_OFFER)
+    if not res.ok:
         driver.fail("offer create failed", kind="assertion", details=res)
 
     offer_id = g.trade_offers[-1].offer_id
     res = driver.do({"type": "trade_offer_accept", "pid": 1, "offer_id": offer_id})
-    if not res.get("ok"):
+    if not res.ok:
         driver.fail("offer accept failed", kind="assertion", details=res)
 
     if g.players[0].res["wood"] != 0 or g.players[0].res["brick"] != 1:
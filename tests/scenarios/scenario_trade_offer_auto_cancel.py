@@ -3,6 +3,7 @@
 from typing import Any, Dict
 
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import end_turn, grant_resources
 
 
 def run(driver: GameDriver) -> Dict[str, Any]:
@@ -11,14 +12,14 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.turn = 0
     g.rolled = True
 
-    driver.do({"type": "grant_resources", "pid": 0, "res": {"wood": 1}})
+    driver.do(grant_resources(0, {"wood": 1}))
     res = driver.do({"type": "trade_offer_create", "pid": 0, "give": {"wood": 1}, "get": {"brick": 1}, "to_pid": 1})
-    if not res.get("ok"):
+    if not res.ok:
         driver.fail("offer create failed", kind="assertion", details=res)
 
     offer_id = g.trade_offers[-1].offer_id
-    res = driver.do({"type": "end_turn", "pid": 0})
-    if not res.get("ok"):
+    res = driver.do(end_turn(0))
+    if not res.ok:
         driver.fail("end_turn failed", kind="assertion", details=res)
 
     offer = None
@@ -3,6 +3,10 @@
 from typing import Any, Dict
 
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import grant_resources
+
+_FUND_P0 = grant_resources(0, {"wood": 1})
+_OFFER = {"type": "trade_offer_create", "pid": 0, "give": {"wood": 1}, "get": {"brick": 1}, "to_pid": 1}
 
 
 def run(driver: GameDriver) -> Dict[str, Any]:
@@ -11,14 +15,14 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.turn = 0
     g.rolled = True
 
-    driver.do({"type": "grant_resources", "pid": 0, "res": {"wood": 1}})
-    res = driver.do({"type": "trade_offer_create", "pid": 0, "give": {"wood": 1}, "get": {"brick": 1}, "to_pid": 1})
-    if not res.get("ok"):
+    driver.do(_FUND_P0)
+    res = driver.do(_OFFER)
+    if not res.ok:
         driver.fail("offer create failed", kind="assertion", details=res)
 
     offer_id = g.trade_offers[-1].offer_id
     res = driver.do({"type": "trade_offer_cancel", "pid": 0, "offer_id": offer_id})
-    if not res.get("ok"):
+    if not res.ok:
         driver.fail("offer cancel failed", kind="assertion", details=res)
 
     offer = g.trade_offers[-1]
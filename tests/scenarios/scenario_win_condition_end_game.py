@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict
 
 from tests.harness.engine import GameDriver
+from tests.scenarios.utils import place_road
 
 
 def run(driver: GameDriver) -> Dict[str, Any]:
@@ -15,10 +16,9 @@ def run(driver: GameDriver) -> Dict[str, Any]:
     g.winner_pid = 0
     g.game_over = True
 
-    action = {"type": "place_road", "pid": 0, "eid": next(iter(g.edges))}
-    driver.steps.append(dict(action))
-    res = driver.apply_action(action)
-    if res.get("ok"):
+    action = place_road(0, min(g.edges))
+    res = driver.attempt(action)
+    if res.ok:
         driver.fail("action allowed after game over", kind="assertion")
 
     if not g.game_over or g.winner_pid is None:
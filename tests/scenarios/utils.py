@@ -1,34 +1,183 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from app.engine import rules as engine_rules
+from app.engine.state import RESOURCES
 from tests.harness.engine import GameDriver
 
+_ZERO_RES = dict.fromkeys(RESOURCES, 0)
+_HAND_COUNTS = itemgetter(*RESOURCES)
+# alphabetical, matching the order discard plans have always been recorded in
+_DISCARD_ORDER = tuple(sorted(RESOURCES))
+
+
+def place_settlement(pid: int, vid: int, *, setup: bool = False) -> Dict[str, Any]:
+    action = {"type": "place_settlement", "pid": pid, "vid": vid}
+    if setup:
+        action["setup"] = True
+    return action
+
+
+def place_road(pid: int, eid, *, setup: bool = False, free: bool = False) -> Dict[str, Any]:
+    action = {"type": "place_road", "pid": pid, "eid": eid}
+    if setup:
+        action["setup"] = True
+    if free:
+        action["free"] = True
+    return action
+
+
+def end_turn(pid: int) -> Dict[str, Any]:
+    return {"type": "end_turn", "pid": pid}
+
+
+def grant_resources(pid: int, res: Dict[str, int]) -> Dict[str, Any]:
+    return {"type": "grant_resources", "pid": pid, "res": res}
+
+
+def grant_resources_bulk(grants: Dict[int, Dict[str, int]]) -> Dict[str, Any]:
+    return {
+        "type": "grant_resources_bulk",
+        "grants": [{"pid": pid, "res": res} for pid, res in grants.items()],
+    }
+
+
+def play_dev(pid: int, card: str, **params: Any) -> Dict[str, Any]:
+    action = {"type": "play_dev", "pid": pid, "card": card}
+    action.update(params)
+    return action
+
+
+def zero_res() -> Dict[str, int]:
+    return _ZERO_RES.copy()
+
+
+def snapshot_hands(g) -> List[Tuple[int, ...]]:
+    # one tuple per player, indexed by state.RES_IDX
+    return [_HAND_COUNTS(p.res) for p in g.players]
+
+
+def discard_need(hand_size: int) -> int:
+    return hand_size // 2 if hand_size > 7 else 0
+
+
+def plan_discard(res: Dict[str, int], need: int) -> Dict[str, int]:
+    # a zero-sized take leaves its entry at 0
+    plan = zero_res()
+    remaining = need
+    for r in _DISCARD_ORDER:
+        if remaining <= 0:
+            break
+        take = min(res[r], remaining)
+        plan[r] = take
+        remaining -= take
+    return plan
+
 
 def run_setup_snake(driver: GameDriver) -> None:
     g = driver.game
     for pid in g.setup_order:
-        legal = driver.legal_settlement_vertices(pid, require_road=False)
-        if not legal:
+        # only the first legal spot is used, so stop scanning once it is found
+        chosen_vid = driver.first_legal_settlement_vertex(pid, require_road=False)
+        if chosen_vid is None:
             driver.fail("no legal settlement in setup", kind="assertion")
-        chosen_vid = legal[0]
-        res = driver.do({"type": "place_settlement", "pid": pid, "vid": chosen_vid, "setup": True})
-        if not res.get("ok"):
+        res = driver.do(place_settlement(pid, chosen_vid, setup=True))
+        if not res.ok:
             driver.fail("setup settlement failed", kind="assertion", details=res)
-        edges = driver.legal_road_edges(pid, must_touch_vid=chosen_vid)
-        if not edges:
+        road = driver.first_legal_road_edge(pid, must_touch_vid=chosen_vid)
+        if road is None:
             driver.fail("no legal road in setup", kind="assertion")
-        road = edges[0]
-        res = driver.do({"type": "place_road", "pid": pid, "eid": road, "setup": True})
-        if not res.get("ok"):
+        res = driver.do(place_road(pid, road, setup=True))
+        if not res.ok:
+            driver.fail("setup road failed", kind="assertion", details=res)
+
+
+def run_setup_with_start(driver: GameDriver, start_pid: int, start_vid: int, *, only_if_legal: bool = False) -> None:
+    # setup where start_pid's first settlement goes on start_vid and everything else takes the first legal spot;
+    # with only_if_legal, start_pid falls back to the first legal spot while start_vid is taken or blocked
+    g = driver.game
+    used_start = False
+    while g.phase == "setup":
+        pid = g.setup_order[g.setup_idx]
+        if (
+            pid == start_pid
+            and not used_start
+            and (not only_if_legal or driver.can_place_settlement(pid, start_vid, require_road=False))
+        ):
+            vid = start_vid
+            used_start = True
+        else:
+            vid = driver.first_legal_settlement_vertex(pid, require_road=False)
+            if vid is None:
+                driver.fail("no legal settlement during setup", kind="assertion")
+        res = driver.do(place_settlement(pid, vid, setup=True))
+        if not res.ok:
+            driver.fail("setup settlement failed", kind="assertion", details=res)
+
+        anchor = int(g.setup_anchor_vid) if g.setup_anchor_vid is not None else vid
+        e = driver.first_legal_road_edge(pid, must_touch_vid=anchor)
+        if e is None:
+            driver.fail("no legal road during setup", kind="assertion")
+        res = driver.do(place_road(pid, [e[0], e[1]], setup=True))
+        if not res.ok:
             driver.fail("setup road failed", kind="assertion", details=res)
 
 
+def build_edge_adj(g) -> Dict[int, List[Tuple[int, int]]]:
+    adj: Dict[int, List[Tuple[int, int]]] = {}
+    for e in g.edges:
+        a, b = e
+        adj.setdefault(a, []).append(e)
+        adj.setdefault(b, []).append(e)
+    return adj
+
+
+def sea_tiles(g) -> FrozenSet[int]:
+    return frozenset(ti for ti, t in enumerate(g.tiles) if t.terrain == "sea")
+
+
+def sea_edge_sets(g) -> Tuple[FrozenSet[Tuple[int, int]], FrozenSet[Tuple[int, int]]]:
+    # (edges touching sea, edges with only sea around them), from one pass over edge_adj_hexes
+    sea_ti = sea_tiles(g)
+    sea = set()
+    sea_only = set()
+    for e, adj in g.edge_adj_hexes.items():
+        if not sea_ti.isdisjoint(adj):
+            sea.add(e)
+            if sea_ti.issuperset(adj):
+                sea_only.add(e)
+    return frozenset(sea), frozenset(sea_only)
+
+
+def pick_coastal_vertex(
+    driver: GameDriver,
+    pid: int,
+    sea_edges: FrozenSet[Tuple[int, int]],
+    sea_only_edges: FrozenSet[Tuple[int, int]],
+) -> Optional[int]:
+    # coastal vertices that also keep a land edge for the setup road
+    g = driver.game
+    sea_vertices = {v for e in sea_edges for v in e}
+    land_vertices = {v for e in g.edges - sea_only_edges for v in e}
+    for vid in sorted(sea_vertices & land_vertices):
+        if driver.can_place_settlement(pid, vid, require_road=False):
+            return vid
+    return None
+
+
+def vids_by_owner(g) -> List[List[int]]:
+    # one pass over occupied_v, indexed by pid
+    out: List[List[int]] = [[] for _ in g.players]
+    for vid, (owner, _lvl) in g.occupied_v.items():
+        out[owner].append(vid)
+    return out
+
+
 def pick_port_vertex(driver: GameDriver) -> Tuple[int, str]:
     g = driver.game
-    for edge, kind in g.ports:
-        for vid in edge:
-            if engine_rules.can_place_settlement(g, 0, vid, require_road=False):
-                return vid, kind
+    for vid, kind in engine_rules.port_vertices(g).items():
+        if driver.can_place_settlement(0, vid, require_road=False):
+            return vid, kind
     raise ValueError("no legal port vertex found")
@@ -39,11 +39,18 @@ async def _send(ws, obj):
     await ws.send(json.dumps(obj))
 
 
+async def _recv_json(ws, timeout: float):
+    # one monotonic deadline for the whole wait; the clock is read once per message
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    remaining = timeout
+    while remaining > 0:
+        yield json.loads(await asyncio.wait_for(ws.recv(), timeout=remaining))
+        remaining = deadline - loop.time()
+
+
 async def _recv_type(ws, want: str, timeout: float = 5.0):
-    end = time.time() + timeout
-    while time.time() < end:
-        raw = await asyncio.wait_for(ws.recv(), timeout=end - time.time())
-        data = json.loads(raw)
+    async for data in _recv_json(ws, timeout):
         if data.get("type") == "error":
             raise AssertionError(f"Server error: {data.get('message')}")
         if data.get("type") == want:
@@ -52,31 +59,22 @@ async def _recv_type(ws, want: str, timeout: float = 5.0):
 
 
 async def _recv_error(ws, want_code: str, timeout: float = 5.0) -> dict:
-    end = time.time() + timeout
-    while time.time() < end:
-        raw = await asyncio.wait_for(ws.recv(), timeout=end - time.time())
-        data = json.loads(raw)
+    async for data in _recv_json(ws, timeout):
         if data.get("type") == "error" and data.get("code") == want_code:
             return data
     raise AssertionError(f"Timed out waiting for error {want_code}")
 
 
 async def _recv_cmd_ack(ws, cmd_id: str, timeout: float = 5.0) -> dict:
-    end = time.time() + timeout
-    while time.time() < end:
-        raw = await asyncio.wait_for(ws.recv(), timeout=end - time.time())
-        data = json.loads(raw)
+    async for data in _recv_json(ws, timeout):
         if data.get("type") == "cmd_ack" and data.get("cmd_id") == cmd_id:
             return data
     raise AssertionError(f"Timed out waiting for cmd_ack {cmd_id}")
 
 
 async def _recv_room_with_map(ws, map_id: str, timeout: float = 5.0) -> dict:
-    end = time.time() + timeout
     last = None
-    while time.time() < end:
-        raw = await asyncio.wait_for(ws.recv(), timeout=end - time.time())
-        data = json.loads(raw)
+    async for data in _recv_json(ws, timeout):
         if data.get("type") == "error":
             raise AssertionError(f"Server error: {data.get('message')}")
         if data.get("type") == "room_state":
@@ -92,13 +90,29 @@ async def _send_cmd(ws, match_id: int, seq: int, cmd: dict, cmd_id: str | None =
     return cid
 
 
-def _apply_snapshot(g, state: dict):
-    g.occupied_v = {int(k): (int(v[0]), int(v[1])) for k, v in state.get("occupied_v", {}).items()}
-    g.occupied_e = {}
-    for k, owner in state.get("occupied_e", {}).items():
+# wire keys ("12" / "3,7") repeat across every match_state; parse each one once
+_VID_KEYS: dict = {}
+_EDGE_KEYS: dict = {}
+
+
+def _vid_key(k) -> int:
+    vid = _VID_KEYS.get(k)
+    if vid is None:
+        vid = _VID_KEYS[k] = int(k)
+    return vid
+
+
+def _edge_key(k) -> tuple:
+    e = _EDGE_KEYS.get(k)
+    if e is None:
         a, b = [int(x) for x in str(k).split(",", 1)]
-        e = (a, b) if a < b else (b, a)
-        g.occupied_e[e] = int(owner)
+        e = _EDGE_KEYS[k] = (a, b) if a < b else (b, a)
+    return e
+
+
+def _apply_snapshot(g, state: dict):
+    g.occupied_v = {_vid_key(k): (int(v[0]), int(v[1])) for k, v in state.get("occupied_v", {}).items()}
+    g.occupied_e = {_edge_key(k): int(owner) for k, owner in state.get("occupied_e", {}).items()}
     g.setup_order = [int(x) for x in state.get("setup_order", [])]
     g.setup_idx = int(state.get("setup_idx", 0))
     g.setup_need = state.get("setup_need", "settlement")
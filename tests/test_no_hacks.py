@@ -10,43 +10,52 @@ APP_DIR = ROOT / "app"
 EXCLUDE_DIRS = {"_legacy", "_legacy_bak", "_legacy_next"}
 
 BANNED_PATTERNS = {
-    "QTimer.singleShot": re.compile(r"QTimer\.singleShot"),
-    "runtime_patch": re.compile(r"\bruntime_patch\b"),
-    "ports_bridge": re.compile(r"\bports_bridge\b"),
-    "monkey_patch": re.compile(r"\bGame\.\w+\s*=\s*"),
-    "findChild": re.compile(r"\bfindChild\s*\("),
+    "QTimer.singleShot": re.compile(rb"QTimer\.singleShot"),
+    "runtime_patch": re.compile(rb"\bruntime_patch\b"),
+    "ports_bridge": re.compile(rb"\bports_bridge\b"),
+    "monkey_patch": re.compile(rb"\bGame\.\w+\s*=\s*"),
+    "findChild": re.compile(rb"\bfindChild\s*\("),
 }
 
-TEXT_LOOKUP = re.compile(r"\.text\(\)")
+TEXT_LOOKUP = re.compile(rb"\.text\(\)")
 
 
-def _iter_py_files():
-    for root, dirs, files in os.walk(APP_DIR):
-        rel = Path(root).relative_to(APP_DIR)
-        if any(part in EXCLUDE_DIRS for part in rel.parts):
-            dirs[:] = []
-            continue
-        for name in files:
-            if name.endswith(".py"):
-                yield Path(root) / name
+def _iter_py_files(root: str = str(APP_DIR)):
+    # same top-down order as os.walk, without a Path per directory or file
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDE_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+    for sub in subdirs:
+        yield from _iter_py_files(sub)
+
+
+def _decode(line: bytes) -> str:
+    return line.decode("utf-8", "replace").strip()
 
 
 def test_no_hacks():
     violations: list[str] = []
     for path in _iter_py_files():
-        text = path.read_text(encoding="utf-8", errors="replace")
-        lines = text.splitlines()
+        # every pattern is ASCII, so scan the raw bytes and decode only the lines that get reported
+        with open(path, "rb") as f:
+            data = f.read()
+        lines = data.splitlines()
 
         for label, pattern in BANNED_PATTERNS.items():
             for i, line in enumerate(lines, 1):
                 if pattern.search(line):
-                    violations.append(f"{path}:{i}: banned {label}: {line.strip()}")
+                    violations.append(f"{path}:{i}: banned {label}: {_decode(line)}")
 
-        if TEXT_LOOKUP.search(text):
-            if "findChild" in text or "findChildren" in text:
+        if TEXT_LOOKUP.search(data):
+            if b"findChild" in data or b"findChildren" in data:
                 for i, line in enumerate(lines, 1):
-                    if ".text()" in line:
-                        violations.append(f"{path}:{i}: suspicious widget lookup: {line.strip()}")
+                    if b".text()" in line:
+                        violations.append(f"{path}:{i}: suspicious widget lookup: {_decode(line)}")
 
     if violations:
         joined = "\n".join(violations)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from app.engine import rules
+
+
+def _hands(g):
+    return [dict(p.res) for p in g.players]
+
+
+def test_bulk_grant_short_bank_leaves_hands_untouched():
+    g = rules.build_game(seed=1, max_players=2, size=58.0)
+    g.bank["wood"] = 3
+    before = _hands(g)
+    cmd = {
+        "type": "grant_resources_bulk",
+        "grants": [
+            {"pid": 0, "res": {"wood": 2, "brick": 1}},
+            {"pid": 1, "res": {"wood": 2}},
+        ],
+    }
+    with pytest.raises(rules.RuleError) as exc:
+        rules.apply_cmd(g, 0, cmd)
+    assert exc.value.code == "illegal"
+    assert _hands(g) == before
+    assert g.bank["wood"] == 3
+
+
+@pytest.mark.parametrize("grants", [
+    [{"pid": "x", "res": {"wood": 1}}],
+    [{"pid": 5, "res": {"wood": 1}}],
+    [1],
+    "wood",
+    [{"pid": 1, "res": ["wood"]}],
+])
+def test_bulk_grant_rejects_bad_entries(grants):
+    g = rules.build_game(seed=1, max_players=2, size=58.0)
+    before = _hands(g)
+    with pytest.raises(rules.RuleError) as exc:
+        rules.apply_cmd(g, 0, {"type": "grant_resources_bulk", "grants": grants})
+    assert exc.value.code == "invalid"
+    assert _hands(g) == before
@@ -1,15 +1,8 @@
-import os
-
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-
-from PySide6 import QtWidgets
-
 from app.config import GameConfig
 from app.main_menu import MainMenuWindow
 
 
-def test_ui_smoke_boot_and_start():
-    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+def test_ui_smoke_boot_and_start(qapp):
     w = MainMenuWindow()
     w.show()
 
@@ -19,4 +12,4 @@ def test_ui_smoke_boot_and_start():
 
     w._game_window.close()
     w.close()
-    app.processEvents()
+    qapp.processEvents()
@@ -23,50 +23,54 @@ RULE_FUNCS = [
 ]
 
 
-def _read(path: Path) -> list[str]:
-    return path.read_text(encoding="utf-8", errors="replace").splitlines()
+def _read(path: Path) -> tuple[str, list[str]]:
+    text = path.read_text(encoding="utf-8", errors="replace")
+    return text, text.splitlines()
 
 
-def _extract_defs(lines: list[str]) -> dict[str, dict]:
+def _extract_defs(lines: list[str], wanted: set[str]) -> dict[str, dict]:
+    # bodies are kept as [start, end) line ranges and only for the wanted names
     defs: dict[str, dict] = {}
     for i, line in enumerate(lines):
         if line.lstrip().startswith("def "):
-            indent = len(line) - len(line.lstrip())
             name = line.strip().split()[1].split("(")[0]
-            body = []
+            if name not in wanted:
+                continue
+            indent = len(line) - len(line.lstrip())
+            end = len(lines)
             for j in range(i + 1, len(lines)):
                 nxt = lines[j]
                 if nxt.strip() == "":
-                    body.append(nxt)
                     continue
                 cur_indent = len(nxt) - len(nxt.lstrip())
                 if cur_indent <= indent and nxt.lstrip().startswith("def "):
+                    end = j
                     break
                 if cur_indent <= indent and nxt.lstrip().startswith("class "):
+                    end = j
                     break
                 if cur_indent < indent and nxt.strip():
+                    end = j
                     break
-                body.append(nxt)
-            defs[name] = {"line": i + 1, "body": "\n".join(body)}
+            defs[name] = {"line": i + 1, "body": (i + 1, end)}
     return defs
 
 
-def _audit_ui(lines: list[str]) -> list[str]:
+def _audit_ui(text: str, lines: list[str]) -> list[str]:
     issues: list[str] = []
-    defs = _extract_defs(lines)
+    defs = _extract_defs(lines, set(RULE_FUNCS))
     for name in RULE_FUNCS:
         if name in defs:
-            body = defs[name]["body"]
-            if "engine_rules" not in body:
+            start, end = defs[name]["body"]
+            if "engine_rules" not in "\n".join(lines[start:end]):
                 issues.append(f"ui_v6.py:{defs[name]['line']}: local rule impl '{name}' without engine_rules")
-    if "engine_rules.apply_cmd" not in "\n".join(lines):
+    if "engine_rules.apply_cmd" not in text:
         issues.append("ui_v6.py: missing engine_rules.apply_cmd usage")
     return issues
 
 
-def _audit_server(lines: list[str]) -> list[str]:
+def _audit_server(text: str) -> list[str]:
     issues: list[str] = []
-    text = "\n".join(lines)
     if "apply_cmd" not in text:
         issues.append("server_mp.py: apply_cmd not found")
     if "to_dict" not in text:
@@ -74,9 +78,8 @@ def _audit_server(lines: list[str]) -> list[str]:
     return issues
 
 
-def _audit_controller(lines: list[str]) -> list[str]:
+def _audit_controller(text: str) -> list[str]:
     issues: list[str] = []
-    text = "\n".join(lines)
     if "apply_snapshot" not in text:
         issues.append("online_controller.py: apply_snapshot not found")
     return issues
@@ -85,14 +88,14 @@ def _audit_controller(lines: list[str]) -> list[str]:
 def main() -> int:
     issues: list[str] = []
 
-    ui_lines = _read(TARGET_FILES["ui_v6"])
-    issues.extend(_audit_ui(ui_lines))
+    ui_text, ui_lines = _read(TARGET_FILES["ui_v6"])
+    issues.extend(_audit_ui(ui_text, ui_lines))
 
-    server_lines = _read(TARGET_FILES["server_mp"])
-    issues.extend(_audit_server(server_lines))
+    server_text, _ = _read(TARGET_FILES["server_mp"])
+    issues.extend(_audit_server(server_text))
 
-    controller_lines = _read(TARGET_FILES["online_controller"])
-    issues.extend(_audit_controller(controller_lines))
+    controller_text, _ = _read(TARGET_FILES["online_controller"])
+    issues.extend(_audit_controller(controller_text))
 
     if issues:
         print("FAIL: engine source audit failed")
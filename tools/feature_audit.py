@@ -1,10 +1,12 @@
 ﻿from __future__ import annotations
 
+import functools
 import json
 import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -30,29 +32,49 @@ def _run(cmd: List[str], log_path: Path) -> Tuple[int, str]:
     return proc.returncode, output
 
 
-def _run_shell(cmd: str, log_path: Path) -> Tuple[int, str]:
-    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, shell=True)
-    output = (proc.stdout or "") + (proc.stderr or "")
-    log_path.write_text(output, encoding="utf-8")
-    return proc.returncode, output
+def _run_shell(cmd: str, log_path: Path) -> int:
+    # output goes straight into the log instead of through a captured str
+    with log_path.open("w", encoding="utf-8") as fh:
+        return subprocess.run(cmd, cwd=ROOT, stdout=fh, stderr=subprocess.STDOUT, shell=True).returncode
 
 
-def _find_line(path: Path, pattern: str) -> Optional[int]:
+_APPLY_CMD_RE = re.compile(r"def apply_cmd\(.*?\):(?P<body>[\s\S]*?)\n\s*def ", re.ASCII)
+# ctype == "a"  |  ctype in ("a", "b")
+_CTYPE_RE = re.compile(r"ctype\s*==\s*\"(?P<eq>.*?)\"|ctype\s*in\s*\((?P<tup>[^\)]*)\)", re.ASCII)
+_STR_RE = re.compile(r"\"(.*?)\"")
+
+
+@functools.lru_cache(maxsize=None)
+def _read_bytes(path: Path) -> Optional[bytes]:
+    # the same handful of source files (rules.py included) back every feature row
     try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        return path.read_bytes()
     except FileNotFoundError:
         return None
+
+
+@functools.lru_cache(maxsize=None)
+def _read_lines(path: Path) -> Optional[Tuple[bytes, ...]]:
+    # the needles are ASCII, so lines stay undecoded bytes
+    data = _read_bytes(path)
+    return None if data is None else tuple(data.splitlines())
+
+
+def _find_line(path: Path, pattern: str) -> Optional[int]:
+    lines = _read_lines(path)
+    if lines is None:
+        return None
+    needle = pattern.encode("utf-8")
     for idx, line in enumerate(lines, 1):
-        if pattern in line:
+        if needle in line:
             return idx
     return None
 
 
 def _find_regex_line(path: Path, pattern: str) -> Optional[int]:
-    rx = re.compile(pattern)
-    try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-    except FileNotFoundError:
+    rx = re.compile(pattern.encode("utf-8"))
+    lines = _read_lines(path)
+    if lines is None:
         return None
     for idx, line in enumerate(lines, 1):
         if rx.search(line):
@@ -62,16 +84,20 @@ def _find_regex_line(path: Path, pattern: str) -> Optional[int]:
 
 def _apply_cmd_types() -> List[str]:
     rules = ROOT / "app" / "engine" / "rules.py"
-    text = rules.read_text(encoding="utf-8", errors="replace")
+    data = _read_bytes(rules)
+    if data is None:
+        raise FileNotFoundError(rules)
+    text = data.decode("utf-8", "replace")
     # isolate apply_cmd body
-    m = re.search(r"def apply_cmd\(.*?\):(?P<body>[\s\S]*?)\n\s*def ", text)
+    m = _APPLY_CMD_RE.search(text)
     body = m.group("body") if m else text
-    types = set(re.findall(r"ctype\s*==\s*\"(.*?)\"", body))
-    # handle: if ctype in ("a", "b")
-    for m2 in re.finditer(r"ctype\s*in\s*\(([^\)]*)\)", body):
-        items = m2.group(1)
-        for s in re.findall(r"\"(.*?)\"", items):
-            types.add(s)
+    types = set()
+    for m2 in _CTYPE_RE.finditer(body):
+        eq = m2.group("eq")
+        if eq is not None:
+            types.add(eq)
+        else:
+            types.update(_STR_RE.findall(m2.group("tup")))
     return sorted(types)
 
 
@@ -84,22 +110,46 @@ def _grep_hacks() -> None:
         'rg -n "QTimer\\.singleShot|runtime_patch|ports_bridge|findChild\\(|\\bGame\\.\\w+\\s*=\\s*" '
         'app -g "*.py" -g "!app/_legacy/**" -g "!app/_legacy_bak/**" -g "!app/_legacy_next/**"'
     )
-    code, output = _run_shell(cmd, LOGS["grep_hacks"])
+    code = _run_shell(cmd, LOGS["grep_hacks"])
     if code == 1:
         LOGS["grep_hacks"].write_text("no matches\n", encoding="utf-8")
     elif code != 0:
-        LOGS["grep_hacks"].write_text(output, encoding="utf-8")
         raise SystemExit(code)
 
 
+PROOF_CMDS = {
+    "pytest": [sys.executable, "-m", "pytest", "-q"],
+    "run_all": [sys.executable, "-m", "tests.run_all"],
+    "no_hacks": [sys.executable, "-m", "pytest", "-q", "tests/test_no_hacks.py"],
+    "engine_audit": [sys.executable, "tools/engine_source_audit.py"],
+    "offline_ui_smoke": [sys.executable, "tools/offline_ui_smoke.py"],
+    "multiplayer_smoke": [sys.executable, "tools/multiplayer_smoke.py"],
+}
+
+
+def _run_proofs() -> Dict[str, int]:
+    # FEATURE_AUDIT_PARALLEL=1 runs the proof commands side by side; each writes only its own log
+    if os.environ.get("FEATURE_AUDIT_PARALLEL") != "1":
+        rc = {}
+        for name, cmd in PROOF_CMDS.items():
+            rc[name], _ = _run(cmd, LOGS[name])
+            if name == "no_hacks":
+                _grep_hacks()
+        return rc
+    with ThreadPoolExecutor(max_workers=len(PROOF_CMDS)) as pool:
+        futures = {name: pool.submit(_run, cmd, LOGS[name]) for name, cmd in PROOF_CMDS.items()}
+        _grep_hacks()
+        return {name: fut.result()[0] for name, fut in futures.items()}
+
+
 def _summarize_log(path: Path, fallback: str = "(no output)") -> str:
     if not path.exists():
         return fallback
     text = path.read_text(encoding="utf-8", errors="replace").strip()
     if not text:
         return fallback
-    lines = text.splitlines()
-    return lines[-1] if lines else text
+    # only the last line is wanted; avoid splitting a long pytest log into a list
+    return text[text.rfind("\n") + 1:]
 
 
 def _status_line(code: int) -> str:
@@ -108,13 +158,13 @@ def _status_line(code: int) -> str:
 
 def main() -> int:
     # Proof commands
-    rc_pytest, _ = _run([sys.executable, "-m", "pytest", "-q"], LOGS["pytest"])
-    rc_run_all, _ = _run([sys.executable, "-m", "tests.run_all"], LOGS["run_all"])
-    rc_no_hacks, _ = _run([sys.executable, "-m", "pytest", "-q", "tests/test_no_hacks.py"], LOGS["no_hacks"])
-    _grep_hacks()
-    rc_engine, _ = _run([sys.executable, "tools/engine_source_audit.py"], LOGS["engine_audit"])
-    rc_offline, _ = _run([sys.executable, "tools/offline_ui_smoke.py"], LOGS["offline_ui_smoke"])
-    rc_mp, _ = _run([sys.executable, "tools/multiplayer_smoke.py"], LOGS["multiplayer_smoke"])
+    rc = _run_proofs()
+    rc_pytest = rc["pytest"]
+    rc_run_all = rc["run_all"]
+    rc_no_hacks = rc["no_hacks"]
+    rc_engine = rc["engine_audit"]
+    rc_offline = rc["offline_ui_smoke"]
+    rc_mp = rc["multiplayer_smoke"]
 
     # Evidence summary
     evidence_lines = [
@@ -145,6 +195,8 @@ def main() -> int:
     server_mp = ROOT / "app" / "server_mp.py"
     lobby_ui = ROOT / "app" / "lobby_ui.py"
     main_menu = ROOT / "app" / "main_menu.py"
+    trade_ui = ROOT / "app" / "trade_ui.py"
+    dev_ui = ROOT / "app" / "dev_ui.py"
     engine_rules = ROOT / "app" / "engine" / "rules.py"
 
     # Feature matrix (manual statuses + pointers)
@@ -292,14 +344,14 @@ def main() -> int:
         "Feature": "Trade UI works and shows correct rate",
         "Status": "IMPLEMENTED",
         "Evidence": "scenario_ports_trade_rates + offline_ui_smoke.txt",
-        "Code": f"app/trade_ui.py:{_find_line(ROOT / 'app' / 'trade_ui.py', 'class TradeDialog')}",
+        "Code": f"app/trade_ui.py:{_find_line(trade_ui, 'class TradeDialog')}",
         "Notes": "Rate computed via engine player_ports/best_trade_rate.",
     })
     features.append({
         "Feature": "Dev UI works and shows hand",
         "Status": "IMPLEMENTED",
         "Evidence": "scenario_dev_cards_restrictions + offline_ui_smoke.txt",
-        "Code": f"app/dev_ui.py:{_find_line(ROOT / 'app' / 'dev_ui.py', 'class DevDialog')}",
+        "Code": f"app/dev_ui.py:{_find_line(dev_ui, 'class DevDialog')}",
         "Notes": "Uses dev_summary from game.",
     })
     features.append({
@@ -5,8 +5,9 @@ import os
 import runpy
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -19,22 +20,20 @@ EXCLUDE_DIRS = {
 }
 
 
-def _is_excluded(path: Path) -> bool:
-    for ex in EXCLUDE_DIRS:
-        if ex in path.parents or path == ex:
-            return True
-    return False
+_EXCLUDED_DIR_PATHS = {str(p) for p in EXCLUDE_DIRS}
 
 
 def _iter_py_files() -> List[Path]:
     files: List[Path] = []
-    for root, _dirs, names in os.walk(APP_DIR):
-        root_path = Path(root)
-        if _is_excluded(root_path):
-            continue
-        for name in names:
-            if name.endswith(".py"):
-                files.append(root_path / name)
+    stack = [str(APP_DIR)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path not in _EXCLUDED_DIR_PATHS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    files.append(Path(entry.path))
     return files
 
 
@@ -63,17 +62,15 @@ def _child_run(target: str, out_path: Path, run_main: bool) -> None:
     if str(ROOT) not in sys.path:
         sys.path.insert(0, str(ROOT))
 
-    import builtins
-    orig_import = builtins.__import__
+    import importlib.abc
 
-    def tracking_import(name, globals=None, locals=None, fromlist=(), level=0):
-        try:
-            imported.add(name)
-        except Exception:
-            pass
-        return orig_import(name, globals, locals, fromlist, level)
+    class _ImportRecorder(importlib.abc.MetaPathFinder):
+        # consulted once per module on first load; returning None defers to the real finders
+        def find_spec(self, fullname, path, target=None):
+            imported.add(fullname)
+            return None
 
-    builtins.__import__ = tracking_import
+    sys.meta_path.insert(0, _ImportRecorder())
 
     if target.endswith(".py") or os.path.sep in target:
         path = Path(target)
@@ -85,7 +82,6 @@ def _child_run(target: str, out_path: Path, run_main: bool) -> None:
         if run_main:
             runpy.run_module(target, run_name="__main__")
         else:
-            import importlib
             importlib.import_module(target)
 
     app_modules = set()
@@ -131,20 +127,27 @@ def _read_list(path: Path) -> Set[str]:
     return {line.strip() for line in path.read_text(encoding="utf-8", errors="replace").splitlines() if line.strip()}
 
 
+_WIN_PATH_RE = re.compile(r"([A-Za-z]:\\\\[^:]+?\\.py)")
+_APP_PATH_RE = re.compile(r"(app[\\/][^:]+?\\.py)")
+
+
 def _extract_ambiguous_paths(lines: Iterable[str]) -> Set[str]:
     out: Set[str] = set()
     for line in lines:
-        m = re.search(r"([A-Za-z]:\\\\[^:]+?\\.py)", line)
-        if m:
-            out.add(m.group(1))
-            continue
-        m = re.search(r"(app[\\/][^:]+?\\.py)", line)
+        m = _WIN_PATH_RE.search(line) or _APP_PATH_RE.search(line)
         if m:
             out.add(m.group(1))
-            continue
     return out
 
 
+def _bullets(items: List[str]) -> Iterator[str]:
+    if not items:
+        yield "- none\n"
+        return
+    for p in items:
+        yield f"- {p}\n"
+
+
 def _write_diff_report(
     report_path: Path,
     runtime_files: Set[str],
@@ -155,36 +158,47 @@ def _write_diff_report(
     missing_runtime = sorted(static_reachable - runtime_files)
     ambiguous_missing = sorted(ambiguous_paths - runtime_files)
 
-    lines: List[str] = []
-    lines.extend(
-        [
-            "# Runtime Imports Diff",
-            "",
-            "## Summary",
-            f"- Runtime files: {len(runtime_files)}",
-            f"- Static reachable files: {len(static_reachable)}",
-            f"- Ambiguous files: {len(ambiguous_paths)}",
-            "",
-            "## In Runtime but not Static Reachable",
-        ]
-    )
-    lines.extend([f"- {p}" for p in only_runtime] if only_runtime else ["- none"])
-    lines.extend(
-        [
-            "",
-            "## Static Reachable but NOT in Runtime",
-        ]
-    )
-    lines.extend([f"- {p}" for p in missing_runtime] if missing_runtime else ["- none"])
-    lines.extend(
-        [
-            "",
-            "## Ambiguous but NOT in Runtime",
-        ]
+    with open(report_path, "w", encoding="utf-8") as fh:
+        fh.write(
+            "# Runtime Imports Diff\n"
+            "\n"
+            "## Summary\n"
+            f"- Runtime files: {len(runtime_files)}\n"
+            f"- Static reachable files: {len(static_reachable)}\n"
+            f"- Ambiguous files: {len(ambiguous_paths)}\n"
+            "\n"
+            "## In Runtime but not Static Reachable\n"
+        )
+        fh.writelines(_bullets(only_runtime))
+        fh.write("\n## Static Reachable but NOT in Runtime\n")
+        fh.writelines(_bullets(missing_runtime))
+        fh.write("\n## Ambiguous but NOT in Runtime\n")
+        fh.writelines(_bullets(ambiguous_missing))
+
+
+def _usage_section(
+    runtime_files: Set[str],
+    static_unreachable: Set[str],
+    ambiguous_paths: Set[str],
+) -> Iterator[str]:
+    used = sorted(runtime_files)
+    safe_unused = sorted(static_unreachable - runtime_files)
+    maybe_unused = sorted(ambiguous_paths - runtime_files)
+
+    yield (
+        "## Runtime Evidence\n"
+        "\n"
+        f"- USED: {len(used)}\n"
+        f"- SAFE_UNUSED: {len(safe_unused)}\n"
+        f"- MAYBE_UNUSED: {len(maybe_unused)}\n"
+        "\n"
+        "### USED\n"
     )
-    lines.extend([f"- {p}" for p in ambiguous_missing] if ambiguous_missing else ["- none"])
-    lines.append("")
-    report_path.write_text("\n".join(lines), encoding="utf-8")
+    yield from _bullets(used)
+    yield "\n### SAFE_UNUSED\n"
+    yield from _bullets(safe_unused)
+    yield "\n### MAYBE_UNUSED\n"
+    yield from _bullets(maybe_unused)
 
 
 def _update_usage_report(
@@ -193,73 +207,50 @@ def _update_usage_report(
     static_unreachable: Set[str],
     ambiguous_paths: Set[str],
 ) -> None:
-    used = sorted(runtime_files)
-    safe_unused = sorted(static_unreachable - runtime_files)
-    maybe_unused = sorted(ambiguous_paths - runtime_files)
-
-    lines: List[str] = []
-    lines.extend(
-        [
-            "## Runtime Evidence",
-            "",
-            f"- USED: {len(used)}",
-            f"- SAFE_UNUSED: {len(safe_unused)}",
-            f"- MAYBE_UNUSED: {len(maybe_unused)}",
-            "",
-            "### USED",
-        ]
-    )
-    lines.extend([f"- {p}" for p in used] if used else ["- none"])
-    lines.extend(
-        [
-            "",
-            "### SAFE_UNUSED",
-        ]
-    )
-    lines.extend([f"- {p}" for p in safe_unused] if safe_unused else ["- none"])
-    lines.extend(
-        [
-            "",
-            "### MAYBE_UNUSED",
-        ]
-    )
-    lines.extend([f"- {p}" for p in maybe_unused] if maybe_unused else ["- none"])
-    lines.append("")
-    section = "\n".join(lines)
+    section = _usage_section(runtime_files, static_unreachable, ambiguous_paths)
 
     if report_path.exists():
         content = report_path.read_text(encoding="utf-8", errors="replace")
         if "## Runtime Evidence" in content:
             content = content.split("## Runtime Evidence")[0].rstrip() + "\n\n"
-        report_path.write_text(content + section, encoding="utf-8")
     else:
-        report_path.write_text("# Usage Audit Report\n\n" + section, encoding="utf-8")
+        content = "# Usage Audit Report\n\n"
+    with open(report_path, "w", encoding="utf-8") as fh:
+        fh.write(content)
+        fh.writelines(section)
 
 
 def _write_safe_move_plan(path: Path, safe_unused: Set[str]) -> None:
-    lines = [
-        "# Safe Move Plan",
-        "",
-        "Move these files to `app/_legacy_next/` (no deletions).",
-        "",
-    ]
-    if safe_unused:
-        lines.extend(f"- {p}" for p in sorted(safe_unused))
-    else:
-        lines.append("- none")
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(
+            "# Safe Move Plan\n"
+            "\n"
+            "Move these files to `app/_legacy_next/` (no deletions).\n"
+            "\n"
+        )
+        fh.writelines(_bullets(sorted(safe_unused)))
 
 
 def parent_main(entries: List[Tuple[str, bool, Optional[Dict[str, str]]]]) -> None:
     TOOLS_DIR.mkdir(parents=True, exist_ok=True)
     outputs: Dict[str, Path] = {}
+    # entries sharing an output file run in order so the last one still wins
+    lanes: Dict[Path, List[Tuple[str, bool, Optional[Dict[str, str]]]]] = {}
 
     for target, run_main, extra_env in entries:
         out_name = f"runtime_imports_{_sanitize_name(target)}.txt"
         out_path = TOOLS_DIR / out_name
-        _run_child(target, out_path, run_main=run_main, extra_env=extra_env)
+        lanes.setdefault(out_path, []).append((target, run_main, extra_env))
         outputs[target] = out_path
 
+    def _run_lane(out_path: Path) -> None:
+        for target, run_main, extra_env in lanes[out_path]:
+            _run_child(target, out_path, run_main=run_main, extra_env=extra_env)
+
+    with ThreadPoolExecutor(max_workers=len(lanes) or 1) as pool:
+        for fut in [pool.submit(_run_lane, out_path) for out_path in lanes]:
+            fut.result()
+
     module_map = _build_module_map(_iter_py_files())
 
     runtime_union_modules: Set[str] = set()
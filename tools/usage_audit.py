@@ -1,7 +1,13 @@
 import ast
+import functools
 import os
+import pickle
 import re
-from collections import defaultdict, deque
+import sys
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, chain
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set, Tuple
 
@@ -16,31 +22,35 @@ EXCLUDE_DIRS = {
 }
 
 
-def _is_excluded(path: Path) -> bool:
-    for ex in EXCLUDE_DIRS:
-        if ex in path.parents or path == ex:
-            return True
-    return False
+_EXCLUDED_DIR_PATHS = {str(p) for p in EXCLUDE_DIRS}
+
+
+def _walk_py(root: str) -> Iterable[str]:
+    # same top-down order as os.walk; excluded trees are pruned instead of filtered per file
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.path not in _EXCLUDED_DIR_PATHS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+    for sub in subdirs:
+        yield from _walk_py(sub)
 
 
 def iter_py_files() -> List[Path]:
-    files: List[Path] = []
-    for root, _dirs, filenames in os.walk(APP_DIR):
-        root_path = Path(root)
-        if _is_excluded(root_path):
-            continue
-        for name in filenames:
-            if name.endswith(".py"):
-                files.append(root_path / name)
-    return files
+    return [Path(p) for p in _walk_py(str(APP_DIR))]
 
 
+@functools.lru_cache(maxsize=None)
 def module_name_for(path: Path) -> str:
     rel = path.relative_to(ROOT)
     parts = list(rel.with_suffix("").parts)
     if parts[-1] == "__init__":
         parts = parts[:-1]
-    return ".".join(parts)
+    # module names are repeated across the graph, map and reachable sets; intern them once
+    return sys.intern(".".join(parts))
 
 
 def build_module_map(files: Iterable[Path]) -> Dict[str, Path]:
@@ -50,6 +60,16 @@ def build_module_map(files: Iterable[Path]) -> Dict[str, Path]:
     return module_to_path
 
 
+@functools.lru_cache(maxsize=None)
+def _read_source(path: Path) -> str:
+    # the AST pass, the regex fallback and the hack scan all read the same files
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+_SYNTAX_ERROR = "<syntax_error>"
+
+
+@functools.lru_cache(maxsize=None)
 def _resolve_relative(current_module: str, level: int) -> Optional[str]:
     if level == 0:
         return ""
@@ -65,11 +85,11 @@ def _iter_imports_ast(path: Path) -> Tuple[List[Tuple[str, Optional[str]]], List
       - list of (import_string, resolved_module_or_None)
       - list of dynamic import strings (string literal) or "" for unknown
     """
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = _read_source(path)
     try:
         tree = ast.parse(text, filename=str(path))
     except SyntaxError:
-        return [], ["<syntax_error>"]
+        return [], [_SYNTAX_ERROR]
 
     imports: List[Tuple[str, Optional[str]]] = []
     dynamic: List[str] = []
@@ -78,7 +98,8 @@ def _iter_imports_ast(path: Path) -> Tuple[List[Tuple[str, Optional[str]]], List
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
             for alias in node.names:
-                imports.append((alias.name, alias.name))
+                name = sys.intern(alias.name)
+                imports.append((name, name))
         elif isinstance(node, ast.ImportFrom):
             mod = node.module or ""
             level = node.level or 0
@@ -86,7 +107,7 @@ def _iter_imports_ast(path: Path) -> Tuple[List[Tuple[str, Optional[str]]], List
             if base is None:
                 imports.append((f"{'.'*level}{mod}", None))
                 continue
-            full_mod = f"{base}.{mod}".strip(".") if mod else base
+            full_mod = sys.intern(f"{base}.{mod}".strip(".") if mod else base)
             if not node.names:
                 imports.append((full_mod, full_mod))
                 continue
@@ -94,7 +115,8 @@ def _iter_imports_ast(path: Path) -> Tuple[List[Tuple[str, Optional[str]]], List
                 if alias.name == "*":
                     imports.append((full_mod, full_mod))
                 else:
-                    imports.append((f"{full_mod}.{alias.name}", f"{full_mod}.{alias.name}"))
+                    name = sys.intern(f"{full_mod}.{alias.name}")
+                    imports.append((name, name))
                     imports.append((full_mod, full_mod))
         elif isinstance(node, ast.Call):
             fn = node.func
@@ -118,7 +140,7 @@ FROM_RE = re.compile(r"^\s*from\s+([a-zA-Z0-9_\.]+)\s+import\s+([a-zA-Z0-9_\.\*]
 
 
 def _iter_imports_fallback(path: Path) -> Set[str]:
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = _read_source(path)
     mods: Set[str] = set()
     for m in IMPORT_RE.finditer(text):
         mods.add(m.group(1))
@@ -137,16 +159,19 @@ def resolve_to_path(module: str, module_map: Dict[str, Path]) -> Optional[Path]:
     return None
 
 
+# "-m module" or "python path/to/file.py", matched in one pass
+ENTRY_RE = re.compile(r"-m\s+(?P<mod>[a-zA-Z0-9_\.]+)|(?i:(?:py|python)(?:\.exe)?\s+(?P<script>[^\s]+\.py))")
+
+
 def parse_entrypoints(module_map: Dict[str, Path]) -> Set[str]:
     entry_modules: Set[str] = set()
     for bat in ROOT.glob("RUN_*.bat"):
         text = bat.read_text(encoding="utf-8", errors="replace")
-        # -m module
-        for m in re.finditer(r"-m\s+([a-zA-Z0-9_\.]+)", text):
-            entry_modules.add(m.group(1))
-        # python path/to/file.py
-        for m in re.finditer(r"(?:py|python)(?:\.exe)?\s+([^\s]+\.py)", text, re.IGNORECASE):
-            rel = Path(m.group(1).strip("\"'"))
+        for m in ENTRY_RE.finditer(text):
+            if m.group("mod"):
+                entry_modules.add(m.group("mod"))
+                continue
+            rel = Path(m.group("script").strip("\"'"))
             if not rel.is_absolute():
                 rel = (ROOT / rel).resolve()
             if rel.exists() and rel.suffix == ".py" and APP_DIR in rel.parents:
@@ -157,16 +182,12 @@ def parse_entrypoints(module_map: Dict[str, Path]) -> Set[str]:
 
 
 def bfs_reachable(entry_modules: Set[str], module_map: Dict[str, Path], graph: Dict[str, Set[str]]) -> Set[str]:
+    # expand a whole frontier per step with C-level set unions
     reachable: Set[str] = set()
-    q = deque(entry_modules)
-    while q:
-        mod = q.popleft()
-        if mod in reachable:
-            continue
-        reachable.add(mod)
-        for nxt in graph.get(mod, set()):
-            if nxt not in reachable:
-                q.append(nxt)
+    frontier = set(entry_modules)
+    while frontier:
+        reachable |= frontier
+        frontier = set().union(*(graph.get(mod, ()) for mod in frontier)) - reachable
     return reachable
 
 
@@ -175,9 +196,15 @@ def build_graph(files: List[Path], module_map: Dict[str, Path]):
     ambiguous: List[str] = []
     dynamic_info: Dict[str, List[str]] = defaultdict(list)
 
-    for f in files:
+    # USAGE_AUDIT_PARALLEL=1 parses files in worker processes; results come back in file order
+    if os.environ.get("USAGE_AUDIT_PARALLEL") == "1":
+        with ProcessPoolExecutor() as pool:
+            parsed = list(pool.map(_iter_imports_ast, files, chunksize=8))
+    else:
+        parsed = [_iter_imports_ast(f) for f in files]
+
+    for f, (imports, dynamic) in zip(files, parsed):
         mod = module_name_for(f)
-        imports, dynamic = _iter_imports_ast(f)
         for imp_str, resolved in imports:
             if not resolved:
                 ambiguous.append(f"{f}: unresolved import '{imp_str}'")
@@ -185,7 +212,7 @@ def build_graph(files: List[Path], module_map: Dict[str, Path]):
             # resolve if inside app
             path = resolve_to_path(resolved, module_map)
             if path is not None:
-                graph[mod].add(resolved)
+                graph[mod].add(sys.intern(resolved))
             else:
                 # may be stdlib or third-party
                 if resolved.startswith("app.") or resolved == "app":
@@ -195,17 +222,58 @@ def build_graph(files: List[Path], module_map: Dict[str, Path]):
             if dyn:
                 dynamic_info[mod].append(dyn)
                 if resolve_to_path(dyn, module_map):
-                    graph[mod].add(dyn)
+                    graph[mod].add(sys.intern(dyn))
             else:
                 ambiguous.append(f"{f}: dynamic import with non-constant module")
 
     return graph, ambiguous, dynamic_info
 
 
-def build_fallback_discrepancies(files: List[Path], module_map: Dict[str, Path], graph: Dict[str, Set[str]]) -> List[str]:
+CACHE_PATH = TOOLS_DIR / ".usage_audit_cache.pkl"
+
+
+def _fingerprint(files: List[Path]) -> List[Tuple[str, int, int]]:
+    # the script itself is included so edits to the audit logic invalidate the cache
+    fp = []
+    for p in [Path(__file__).resolve(), *files]:
+        st = p.stat()
+        fp.append((str(p), st.st_mtime_ns, st.st_size))
+    return fp
+
+
+def build_graph_cached(files: List[Path], module_map: Dict[str, Path]):
+    fp = _fingerprint(files)
+    try:
+        with CACHE_PATH.open("rb") as f:
+            cached = pickle.load(f)
+        if cached["fp"] == fp:
+            return cached["graph"]
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+        pass
+    result = build_graph(files, module_map)
+    # write beside the cache and swap it in, so an interrupted run never leaves a truncated pickle
+    tmp = CACHE_PATH.with_name(f"{CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            pickle.dump({"fp": fp, "graph": result}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, CACHE_PATH)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+    return result
+
+
+def build_fallback_discrepancies(
+    files: List[Path],
+    module_map: Dict[str, Path],
+    graph: Dict[str, Set[str]],
+    dynamic_info: Dict[str, List[str]],
+) -> List[str]:
     discrep = []
     for f in files:
         mod = module_name_for(f)
+        # a parsed file already has every import statement in the AST graph
+        if _SYNTAX_ERROR not in dynamic_info.get(mod, ()):
+            continue
         fallback_mods = _iter_imports_fallback(f)
         ast_mods = graph.get(mod, set())
         for fm in sorted(fallback_mods):
@@ -218,36 +286,47 @@ def write_list(path: Path, items: Iterable[str]) -> None:
     path.write_text("\n".join(sorted(set(items))) + "\n", encoding="utf-8")
 
 
+HACK_PATTERNS = {
+    "QTimer.singleShot": re.compile(r"QTimer\.singleShot"),
+    "monkey_patch_Game": re.compile(r"\bGame\.[A-Za-z_][A-Za-z0-9_]*\s*="),
+    "runtime_patch_import": re.compile(r"\bruntime_patch\b"),
+    "ports_bridge_import": re.compile(r"\bports_bridge\b"),
+    "findChild": re.compile(r"\bfindChild\s*\("),
+    "objectName": re.compile(r"\bobjectName\s*\("),
+    "text_search": re.compile(r"\.text\s*\("),
+}
+# zero-width alternation over every pattern: one pass per file finds the candidate lines,
+# which are then checked pattern by pattern exactly as before
+HACK_SCAN = re.compile("(?=" + "|".join(f"(?:{rx.pattern})" for rx in HACK_PATTERNS.values()) + ")")
+
+
 def scan_hacks(files: List[Path]) -> Dict[str, List[str]]:
-    patterns = {
-        "QTimer.singleShot": re.compile(r"QTimer\.singleShot"),
-        "monkey_patch_Game": re.compile(r"\bGame\.[A-Za-z_][A-Za-z0-9_]*\s*="),
-        "runtime_patch_import": re.compile(r"\bruntime_patch\b"),
-        "ports_bridge_import": re.compile(r"\bports_bridge\b"),
-        "findChild": re.compile(r"\bfindChild\s*\("),
-        "objectName": re.compile(r"\bobjectName\s*\("),
-        "text_search": re.compile(r"\.text\s*\("),
-    }
-    hits: Dict[str, List[str]] = {k: [] for k in patterns}
+    hits: Dict[str, List[str]] = {k: [] for k in HACK_PATTERNS}
     for f in files:
-        text = f.read_text(encoding="utf-8", errors="replace").splitlines()
-        for i, line in enumerate(text, 1):
-            for name, rx in patterns.items():
+        text = _read_source(f)
+        starts = [m.start() for m in HACK_SCAN.finditer(text)]
+        if not starts:
+            continue
+        lines = text.splitlines()
+        line_ends = list(accumulate(len(line) for line in text.splitlines(True)))
+        for idx in sorted({bisect_right(line_ends, pos) for pos in starts}):
+            line = lines[idx]
+            for name, rx in HACK_PATTERNS.items():
                 if rx.search(line):
-                    hits[name].append(f"{f}:{i}: {line.strip()}")
+                    hits[name].append(f"{f}:{idx + 1}: {line.strip()}")
     return hits
 
 
 def main():
     files = iter_py_files()
     module_map = build_module_map(files)
-    graph, ambiguous, dynamic_info = build_graph(files, module_map)
+    graph, ambiguous, dynamic_info = build_graph_cached(files, module_map)
     entry_modules = parse_entrypoints(module_map)
     reachable = bfs_reachable(entry_modules, module_map, graph)
     all_modules = set(module_map.keys())
     unreachable = sorted(all_modules - reachable)
 
-    fallback_discrep = build_fallback_discrepancies(files, module_map, graph)
+    fallback_discrep = build_fallback_discrepancies(files, module_map, graph, dynamic_info)
     ambiguous_all = list(ambiguous) + list(fallback_discrep)
 
     reachable_files = [str(module_map[m].relative_to(ROOT)) for m in sorted(reachable)]
@@ -258,64 +337,61 @@ def main():
     write_list(ROOT / "ambiguous_imports.txt", ambiguous_all)
 
     # hack scan only on reachable files
-    reachable_paths = [module_map[m] for m in reachable if m in module_map]
+    reachable_paths = [module_map[m] for m in sorted(reachable) if m in module_map]
     hacks = scan_hacks(reachable_paths)
 
     TOOLS_DIR.mkdir(parents=True, exist_ok=True)
 
     hacks_path = TOOLS_DIR / "hacks_report.md"
-    with hacks_path.open("w", encoding="utf-8") as f:
-        f.write("# Hacks Report (Reachable Files)\n\n")
-        for key, items in hacks.items():
-            f.write(f"## {key}\n\n")
-            if not items:
-                f.write("- none\n\n")
-                continue
-            for line in items:
-                f.write(f"- {line}\n")
-            f.write("\n")
+    out = ["# Hacks Report (Reachable Files)\n\n"]
+    for key, items in hacks.items():
+        out.append(f"## {key}\n\n")
+        if not items:
+            out.append("- none\n\n")
+            continue
+        for line in items:
+            out.append(f"- {line}\n")
+        out.append("\n")
+    hacks_path.write_text("".join(out), encoding="utf-8")
 
     # usage audit report
     report_path = TOOLS_DIR / "usage_audit_report.md"
-    import_counts = defaultdict(int)
-    for src, dsts in graph.items():
-        for d in dsts:
-            import_counts[d] += 1
-    risky = sorted(import_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-
-    with report_path.open("w", encoding="utf-8") as f:
-        f.write("# Usage Audit Report\n\n")
-        f.write("## Summary\n\n")
-        f.write(f"- Entry modules: {', '.join(sorted(entry_modules)) or 'none found'}\n")
-        f.write(f"- Reachable files: {len(reachable_files)}\n")
-        f.write(f"- Unreachable files: {len(unreachable_files)}\n")
-        f.write(f"- Ambiguous imports: {len(ambiguous_all)}\n\n")
-
-        f.write("## Top Unused Candidates\n\n")
-        for p in unreachable_files[:20]:
-            f.write(f"- {p} (unreachable from entrypoints)\n")
-        if len(unreachable_files) > 20:
-            f.write(f"- ... and {len(unreachable_files) - 20} more\n")
-        f.write("\n")
-
-        f.write("## Risky Files (high fan-in or dynamic imports)\n\n")
-        if risky:
-            for mod, cnt in risky:
-                f.write(f"- {module_map[mod].relative_to(ROOT)} (imported by {cnt})\n")
-        else:
-            f.write("- none\n")
-        f.write("\n")
-
-        if dynamic_info:
-            f.write("## Dynamic Imports\n\n")
-            for mod, items in dynamic_info.items():
-                f.write(f"- {mod}: {', '.join(items)}\n")
-            f.write("\n")
-
-        f.write("## Suggested Safe Actions\n\n")
-        f.write("- Move unreachable files to `app/_legacy/` (no deletions).\n")
-        f.write("- Keep ambiguous imports until resolved.\n")
-        f.write("- Refactor hack patterns (see `tools/hacks_report.md`).\n")
+    # most_common keeps first-seen order among equal counts, like the stable sort it replaces
+    risky = Counter(chain.from_iterable(graph.values())).most_common(10)
+
+    out = ["# Usage Audit Report\n\n"]
+    out.append("## Summary\n\n")
+    out.append(f"- Entry modules: {', '.join(sorted(entry_modules)) or 'none found'}\n")
+    out.append(f"- Reachable files: {len(reachable_files)}\n")
+    out.append(f"- Unreachable files: {len(unreachable_files)}\n")
+    out.append(f"- Ambiguous imports: {len(ambiguous_all)}\n\n")
+
+    out.append("## Top Unused Candidates\n\n")
+    for p in unreachable_files[:20]:
+        out.append(f"- {p} (unreachable from entrypoints)\n")
+    if len(unreachable_files) > 20:
+        out.append(f"- ... and {len(unreachable_files) - 20} more\n")
+    out.append("\n")
+
+    out.append("## Risky Files (high fan-in or dynamic imports)\n\n")
+    if risky:
+        for mod, cnt in risky:
+            out.append(f"- {module_map[mod].relative_to(ROOT)} (imported by {cnt})\n")
+    else:
+        out.append("- none\n")
+    out.append("\n")
+
+    if dynamic_info:
+        out.append("## Dynamic Imports\n\n")
+        for mod, items in dynamic_info.items():
+            out.append(f"- {mod}: {', '.join(items)}\n")
+        out.append("\n")
+
+    out.append("## Suggested Safe Actions\n\n")
+    out.append("- Move unreachable files to `app/_legacy/` (no deletions).\n")
+    out.append("- Keep ambiguous imports until resolved.\n")
+    out.append("- Refactor hack patterns (see `tools/hacks_report.md`).\n")
+    report_path.write_text("".join(out), encoding="utf-8")
 
     print("Usage audit complete.")
     print(f"Reachable: {len(reachable_files)}, Unreachable: {len(unreachable_files)}, Ambiguous: {len(ambiguous_all)}")